@@ -62,11 +62,12 @@ class MusicController:
         try:
             script_path = os.path.join(SCRIPTS_DIR, 'stop_music.sh')
             
-            subprocess.run(
+            # Fire and forget - the script sleeps between its pkill passes,
+            # so waiting on it would block the caller for over a second
+            subprocess.Popen(
                 ['/bin/bash', script_path],
                 stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                timeout=10
+                stderr=subprocess.DEVNULL
             )
             
             self._is_playing = False
@@ -401,10 +401,14 @@ class YouTubeMusicPlayer:
         """Stop the mpv process."""
         if self.mpv_process:
             try:
-                self.mpv_process.terminate()
-                self.mpv_process.wait(timeout=3)
-            except subprocess.TimeoutExpired:
-                self.mpv_process.kill()
+                # Already exited (track ended) - nothing to signal
+                if self.mpv_process.poll() is None:
+                    self.mpv_process.terminate()
+                    try:
+                        self.mpv_process.wait(timeout=0.3)
+                    except subprocess.TimeoutExpired:
+                        self.mpv_process.kill()
+                        self.mpv_process.wait()
             except Exception as e:
                 logger.error(f"Error stopping mpv: {e}")
             finally:
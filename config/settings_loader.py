@@ -29,6 +29,7 @@ def load_settings() -> Dict[str, Any]:
         'clock_timeout': 120,
         'display_width': 1024,
         'display_height': 600,
+        'photo_cache_max_mb': 200,  # On-disk scaled photo cache
     }
     
     try:
@@ -5,6 +5,7 @@ Thread-safe singleton pattern.
 """
 
 import threading
+import weakref
 from typing import Optional, Callable, Dict, Any
 from datetime import datetime
 
@@ -152,29 +153,59 @@ class AppState:
             self._current_track = track
             self._trigger_callback('track_changed', track)
     
+    def notify_search_completed(self, query: str, track: Optional[Dict[str, Any]]):
+        """Signal that a music search finished (track is None on failure)."""
+        with self._lock:
+            self._trigger_callback('search_completed', {'query': query, 'track': track})
+    
     # ========================================================================
     # Callbacks
     # ========================================================================
     
-    def register_callback(self, event: str, callback: Callable):
+    def register_callback(self, event: str, callback: Callable, weak: bool = False):
         """
         Register a callback for an event.
         
+        With weak=True a bound method is held by weak reference, so the
+        registration doesn't keep its object (e.g. a view) alive. It is
+        dropped automatically once the object is garbage collected.
+        
         Events:
         - view_changed: Called when view changes
         - photo_changed: Called when photo index changes
         - music_state_changed: Called when music play/pause state changes
         - track_changed: Called when track changes
+        - search_completed: Called when a music search finishes
         """
         with self._lock:
             if event not in self._callbacks:
                 self._callbacks[event] = []
+            if weak and hasattr(callback, '__self__'):
+                callback = weakref.WeakMethod(callback)
             self._callbacks[event].append(callback)
     
+    def unregister_callback(self, event: str, callback: Callable):
+        """Remove a previously registered callback (no-op if not registered)."""
+        with self._lock:
+            callbacks = self._callbacks.get(event, [])
+            for entry in callbacks:
+                if entry == callback or (isinstance(entry, weakref.WeakMethod) and entry() == callback):
+                    callbacks.remove(entry)
+                    break
+    
     def _trigger_callback(self, event: str, data=None):
         """Trigger callbacks for an event (must hold lock)."""
         if event in self._callbacks:
-            for callback in self._callbacks[event]:
+            # Copy so callbacks may unregister themselves while dispatching
+            for entry in list(self._callbacks[event]):
+                if isinstance(entry, weakref.WeakMethod):
+                    callback = entry()
+                    if callback is None:
+                        # Owner was garbage collected
+                        self._callbacks[event].remove(entry)
+                        continue
+                else:
+                    callback = entry
                 try:
                     callback(data)
                 except Exception as e:
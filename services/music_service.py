@@ -5,8 +5,11 @@ Runs in QThread to avoid blocking UI.
 """
 
 import logging
+import shutil
 import subprocess
 import threading
+import time
+from collections import OrderedDict
 from typing import Optional, Dict, List
 from PyQt5.QtCore import QThread, pyqtSignal, QProcess
 from pathlib import Path
@@ -31,6 +34,10 @@ class MusicService(QThread):
     track_changed = pyqtSignal(dict)  # Emitted when track changes
     playback_state_changed = pyqtSignal(bool, bool)  # playing, paused
     
+    # Search result cache (normalized query -> track info)
+    SEARCH_CACHE_SIZE = 128
+    SEARCH_CACHE_TTL = 24 * 3600  # seconds
+    
     def __init__(self, app_state: AppState):
         super().__init__()
         self.app_state = app_state
@@ -39,34 +46,25 @@ class MusicService(QThread):
         self.track_queue: List[Dict] = []
         self.track_history: List[Dict] = []
         self.current_queue_index = -1
+        self._search_cache: Dict[str, tuple] = OrderedDict()
         self._running = False
         self._lock = threading.Lock()
         
-        # Check dependencies
         self._check_dependencies()
     
     def _check_dependencies(self):
-        """Check if required tools are installed."""
+        """Check if required tools are installed (PATH lookup, no process spawned)."""
         # Check yt-dlp
-        try:
-            result = subprocess.run(
-                ['yt-dlp', '--version'],
-                capture_output=True,
-                timeout=5
-            )
-            logger.info(f"yt-dlp found: {result.stdout.decode().strip()}")
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+        path = shutil.which('yt-dlp')
+        if path:
+            logger.info(f"yt-dlp found: {path}")
+        else:
             logger.warning("yt-dlp not found. Install with: pip install yt-dlp")
         
         # Check mpv
-        try:
-            result = subprocess.run(
-                ['mpv', '--version'],
-                capture_output=True,
-                timeout=5
-            )
+        if shutil.which('mpv'):
             logger.info("mpv found")
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+        else:
             logger.warning("mpv not found. Install with: sudo apt-get install mpv (Linux)")
     
     def run(self):
@@ -92,71 +90,119 @@ class MusicService(QThread):
         """
         Search YouTube and play the top result.
         
+        Repeated queries are served from an in-memory cache, skipping yt-dlp.
+        
         Args:
             query: Search query (song name, artist, etc.)
             
         Returns:
             True if successful
         """
+        cache_key = query.strip().casefold()
+        
         def _search_thread():
+            track_info = None
             try:
-                logger.info(f"Searching YouTube for: {query}")
-                
-                # Use yt-dlp to search and get video URL
-                search_cmd = [
-                    'yt-dlp',
-                    '--default-search', 'ytsearch1:',
-                    '--skip-download',
-                    '--get-id',
-                    '--get-title',
-                    '--get-uploader',
-                    '--get-duration',
-                    query
-                ]
+                track_info = self._get_cached_search(cache_key)
+                if track_info:
+                    logger.info(f"Search cache hit for: {query}")
+                else:
+                    track_info = self._youtube_search(query)
+                    if not track_info:
+                        return
+                    self._cache_search(cache_key, track_info)
                 
-                result = subprocess.run(
-                    search_cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=15
-                )
+                # Play this track
+                self._play_track(track_info)
                 
-                if result.returncode != 0:
-                    logger.error(f"Search failed: {result.stderr}")
-                    return
-                
-                # Parse result (format: title\nuploader\nduration\nvideo_id)
-                lines = result.stdout.strip().split('\n')
-                if len(lines) >= 2:
-                    title = lines[0]
-                    video_id = lines[-1]  # Last line is video ID
-                    
-                    # Build track info
-                    track_info = {
-                        'title': title,
-                        'artist': lines[1] if len(lines) > 2 else 'Unknown',
-                        'video_id': video_id,
-                        'url': f'https://www.youtube.com/watch?v={video_id}'
-                    }
-                    
-                    # Play this track
-                    self._play_track(track_info)
-                    
-                    # Add to queue
-                    with self._lock:
-                        self.track_queue.append(track_info)
-                        self.current_queue_index = len(self.track_queue) - 1
+                # Add to queue
+                with self._lock:
+                    self.track_queue.append(track_info)
+                    self.current_queue_index = len(self.track_queue) - 1
                 
             except subprocess.TimeoutExpired:
                 logger.error("Search timeout")
             except Exception as e:
                 logger.error(f"Search error: {e}")
+            finally:
+                self.app_state.notify_search_completed(query, track_info)
         
         # Run search in background thread
         thread = threading.Thread(target=_search_thread, daemon=True)
         thread.start()
         return True
     
+    def _youtube_search(self, query: str) -> Optional[Dict]:
+        """
+        Resolve a query to the top YouTube result via yt-dlp.
+        
+        Returns:
+            Track info dict, or None if nothing was found
+        """
+        logger.info(f"Searching YouTube for: {query}")
+        
+        # Use yt-dlp to search and get video URL
+        search_cmd = [
+            'yt-dlp',
+            '--default-search', 'ytsearch1:',
+            '--skip-download',
+            '--get-id',
+            '--get-title',
+            '--get-uploader',
+            '--get-duration',
+            query
+        ]
+        
+        result = subprocess.run(
+            search_cmd,
+            capture_output=True,
+            text=True,
+            timeout=15
+        )
+        
+        if result.returncode != 0:
+            logger.error(f"Search failed: {result.stderr}")
+            return None
+        
+        # Parse result (format: title\nuploader\nduration\nvideo_id)
+        lines = result.stdout.strip().split('\n')
+        if len(lines) < 2:
+            return None
+        
+        title = lines[0]
+        video_id = lines[-1]  # Last line is video ID
+        
+        # Build track info
+        return {
+            'title': title,
+            'artist': lines[1] if len(lines) > 2 else 'Unknown',
+            'video_id': video_id,
+            'url': f'https://www.youtube.com/watch?v={video_id}'
+        }
+    
+    def _get_cached_search(self, key: str) -> Optional[Dict]:
+        """Get a cached search result, or None if missing or expired."""
+        with self._lock:
+            entry = self._search_cache.get(key)
+            if entry is None:
+                return None
+            
+            cached_at, track = entry
+            if time.monotonic() - cached_at > self.SEARCH_CACHE_TTL:
+                del self._search_cache[key]
+                return None
+            
+            self._search_cache.move_to_end(key)
+            return dict(track)
+    
+    def _cache_search(self, key: str, track: Dict):
+        """Store a search result, evicting the least recently used entry."""
+        with self._lock:
+            self._search_cache[key] = (time.monotonic(), dict(track))
+            self._search_cache.move_to_end(key)
+            if len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+    
     def _play_track(self, track: Dict):
         """
         Play a track using mpv.
@@ -142,23 +142,52 @@ class PhotoService(QThread):
             return None
         return self.photos[self.current_index]
     
-    def next_photo(self):
-        """Move to next photo."""
-        if not self.photos:
-            return
+    def peek_photo_path(self, offset: int) -> Optional[Path]:
+        """
+        Get the path offset steps from the current photo, without moving.
         
-        self.current_index = (self.current_index + 1) % len(self.photos)
-        self.app_state.set_photo_index(self.current_index)
-        logger.debug(f"Next photo: {self.current_index}/{len(self.photos)}")
+        Args:
+            offset: Steps from the current photo (negative = backwards), wrapping
+            
+        Returns:
+            Path to that photo, or None if no photos
+        """
+        photos = self.photos  # Rescans replace the list from the service thread
+        if not photos:
+            return None
+        return photos[(self.current_index + offset) % len(photos)]
     
-    def previous_photo(self):
-        """Move to previous photo."""
-        if not self.photos:
-            return
+    def next_photo(self) -> Optional[Path]:
+        """
+        Move to next photo.
         
-        self.current_index = (self.current_index - 1) % len(self.photos)
-        self.app_state.set_photo_index(self.current_index)
-        logger.debug(f"Previous photo: {self.current_index}/{len(self.photos)}")
+        Returns:
+            Path of the photo now current, or None if no photos
+        """
+        return self._step(1)
+    
+    def previous_photo(self) -> Optional[Path]:
+        """
+        Move to previous photo.
+        
+        Returns:
+            Path of the photo now current, or None if no photos
+        """
+        return self._step(-1)
+    
+    def _step(self, offset: int) -> Optional[Path]:
+        """Move offset photos (wrapping), notifying only if the photo changed."""
+        photos = self.photos  # Rescans replace the list from the service thread
+        if not photos:
+            return None
+        
+        index = (self.current_index + offset) % len(photos)
+        if index != self.current_index:
+            # A one-photo library wraps onto itself - nothing to redraw
+            self.current_index = index
+            self.app_state.set_photo_index(index)
+            logger.debug(f"Photo {index}/{len(photos)}")
+        return photos[index]
     
     def set_photo_index(self, index: int):
         """Set photo index directly."""
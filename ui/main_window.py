@@ -95,7 +95,7 @@ class MainWindow(QMainWindow):
         self.home_view = HomeView(self.app_state, self._navigate)
         self.menu_view = MenuView(self.app_state, self._navigate)
         self.photo_view = PhotoView(self.app_state, self.photo_service, self._navigate)
-        self.music_view = MusicView(self.app_state, self.music_service, self._navigate)
+        self.music_view = None  # Built on first navigation (see view_factories)
         self.settings_view = SettingsView(self.app_state, self._navigate)
         self.messages_view = MessagesView(self.app_state, self._navigate)
         self.games_view = GamesView(self.app_state, self._navigate)
@@ -105,7 +105,6 @@ class MainWindow(QMainWindow):
             AppState.VIEW_HOME: self.home_view,
             AppState.VIEW_MENU: self.menu_view,
             AppState.VIEW_PHOTOS: self.photo_view,
-            AppState.VIEW_MUSIC: self.music_view,
             AppState.VIEW_SETTINGS: self.settings_view,
             AppState.VIEW_MESSAGES: self.messages_view,
             AppState.VIEW_GAMES: self.games_view,
@@ -114,6 +113,12 @@ class MainWindow(QMainWindow):
         for view in self.views.values():
             self.stack.addWidget(view)
 
+        # Views that are costly to build and often never opened are
+        # constructed lazily on first navigation
+        self.view_factories = {
+            AppState.VIEW_MUSIC: self._create_music_view,
+        }
+
         # Message overlay (always on top)
         self.message_overlay = MessageOverlay(central)
         self.message_overlay.dismissed.connect(self._on_overlay_dismissed)
@@ -164,7 +169,9 @@ class MainWindow(QMainWindow):
             return
             
         if view_name not in self.views:
-            return
+            if view_name not in self.view_factories:
+                return
+            self._build_view(view_name)
 
         logger.info("Navigating to %s", view_name)
         self.app_state.set_current_view(view_name)
@@ -179,6 +186,17 @@ class MainWindow(QMainWindow):
                 if hasattr(view, "on_deactivate"):
                     view.on_deactivate()
 
+    def _create_music_view(self):
+        self.music_view = MusicView(self.app_state, self.music_service, self._navigate)
+        return self.music_view
+
+    def _build_view(self, view_name: str):
+        """Construct a lazily-created view and add it to the stack."""
+        logger.info("Building %s view", view_name)
+        view = self.view_factories.pop(view_name)()
+        self.views[view_name] = view
+        self.stack.addWidget(view)
+
     def _check_idle(self):
         # Don't go idle if overlay is showing
         if self.message_overlay and self.message_overlay.isVisible():
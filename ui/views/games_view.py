@@ -5,10 +5,11 @@ Text-based game list with arrow selection.
 
 import logging
 from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QStackedWidget, QPushButton
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QStackedWidget
 from PyQt5.QtGui import QFont, QKeyEvent
 
 from models.app_state import AppState
+from ui.widgets.close_button import CloseButton
 from ui.games.snake_game import SnakeGameWidget
 from ui.games.tictactoe_game import TicTacToeWidget
 from ui.games.wordle_game import WordleWidget
@@ -98,21 +99,8 @@ class GamesView(QWidget):
         top_bar_layout = QHBoxLayout()
         top_bar_layout.addStretch()
         
-        self.close_btn = QPushButton("✕")
-        self.close_btn.setFixedSize(50, 50)
-        self.close_btn.setFont(QFont("Arial", 20, QFont.Bold))
+        self.close_btn = CloseButton()
         self.close_btn.clicked.connect(lambda: self._go_back())
-        self.close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #F44336;
-                color: white;
-                border-radius: 25px;
-                border: none;
-            }
-            QPushButton:pressed {
-                background-color: #D32F2F;
-            }
-        """)
         top_bar_layout.addWidget(self.close_btn)
         layout.addLayout(top_bar_layout)
         
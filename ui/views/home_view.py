@@ -6,9 +6,10 @@ Pure black background, monospace text.
 
 import logging
 from datetime import datetime
-from PyQt5.QtCore import Qt, QTimer, QRectF
+from PyQt5.QtCore import Qt, QTimer, QRectF, QSize
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel
-from PyQt5.QtGui import QFont, QPainter, QPen, QBrush, QColor, QPixmap
+from PyQt5.QtGui import (QFont, QPainter, QPen, QBrush, QColor, QPixmap, QImageReader,
+                         QImageIOHandler)
 
 try:
     import pyttsx3
@@ -42,6 +43,7 @@ class HomeView(QWidget):
         self.is_day_mode = True
         self.mic_enabled = False
         self.current_photo = None
+        self._photo_cache = (None, None)  # ((path, w, h), scaled QPixmap)
         self.photo_index = 0
         self.transcription_text = ''
         self.show_transcription = False
@@ -235,10 +237,8 @@ class HomeView(QWidget):
         
         if photo_path:
             try:
-                pixmap = QPixmap(photo_path)
-                if not pixmap.isNull():
-                    scaled = pixmap.scaled(photo_w, photo_h, 
-                                          Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                scaled = self._load_photo_pixmap(photo_path, photo_w, photo_h)
+                if scaled is not None:
                     px = photo_x + (photo_w - scaled.width()) // 2
                     py = photo_y + (photo_h - scaled.height()) // 2
                     painter.drawPixmap(px, py, scaled)
@@ -259,6 +259,28 @@ class HomeView(QWidget):
         # Store photo rect for click detection
         self._photo_rect = QRectF(photo_x, photo_y, photo_w, photo_h)
     
+    def _load_photo_pixmap(self, photo_path, w, h):
+        """Photo scaled to fit w x h, decoded once per photo and size."""
+        key = (str(photo_path), w, h)
+        if self._photo_cache[0] == key:
+            return self._photo_cache[1]
+        
+        # Decode straight to the display size (libjpeg scales in the DCT
+        # domain) rather than materializing the full-resolution image
+        reader = QImageReader(str(photo_path))
+        reader.setAutoTransform(True)  # Honour EXIF orientation
+        size = reader.size()
+        if size.isValid():
+            fit = QSize(w, h)
+            if reader.transformation() & QImageIOHandler.TransformationRotate90:
+                fit.transpose()  # Scaled size applies before rotation
+            reader.setScaledSize(size.scaled(fit, Qt.KeepAspectRatio))
+        image = reader.read()
+        pixmap = QPixmap.fromImage(image) if not image.isNull() else None
+        
+        self._photo_cache = (key, pixmap)
+        return pixmap
+    
     def _draw_menu_button(self, painter, w, h):
         """Draw Menu button at bottom-right."""
         btn_w = 120
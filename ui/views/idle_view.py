@@ -54,10 +54,8 @@ class IdleView(QWidget):
         self.cycle_timer.timeout.connect(self._cycle_expression)
         self.cycle_timer.start(15000)  # Check every 15 seconds
         
-        # Repaint timer
-        self.repaint_timer = QTimer()
-        self.repaint_timer.timeout.connect(self.update)
-        self.repaint_timer.start(100)  # 10 FPS is enough
+        # No repaint timer: the face only changes on expression swaps, and
+        # each of those calls update() itself
     
     def _schedule_next_blink(self):
         """Schedule next blink at random interval."""
@@ -229,11 +227,9 @@ class IdleView(QWidget):
         self.expression = self.STATE_AWAKE
         self._cycle_expression()  # Check if should be sleeping
         self._schedule_next_blink()
-        self.repaint_timer.start(100)
         self.update()
     
     def on_deactivate(self):
         """Called when view becomes inactive."""
         logger.debug("Idle view deactivated")
         self.blink_timer.stop()
-        self.repaint_timer.stop()
@@ -5,10 +5,12 @@ Simple text-based menu with arrow selection.
 
 import logging
 from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel
 from PyQt5.QtGui import QFont, QKeyEvent
 
 from models.app_state import AppState
+from ui.widgets.close_button import CloseButton
+from ui.widgets.retro_font import retro_font
 
 logger = logging.getLogger(__name__)
 
@@ -48,27 +50,14 @@ class MenuView(QWidget):
         top_bar_layout = QHBoxLayout()
         top_bar_layout.addStretch()
         
-        self.close_btn = QPushButton("✕")
-        self.close_btn.setFixedSize(50, 50)
-        self.close_btn.setFont(QFont("Arial", 20, QFont.Bold))
+        self.close_btn = CloseButton()
         self.close_btn.clicked.connect(lambda: self.navigate(AppState.VIEW_HOME))
-        self.close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #F44336;
-                color: white;
-                border-radius: 25px;
-                border: none;
-            }
-            QPushButton:pressed {
-                background-color: #D32F2F;
-            }
-        """)
         top_bar_layout.addWidget(self.close_btn)
         layout.addLayout(top_bar_layout)
         
         # Title
         self.title_label = QLabel("MENU")
-        self.title_label.setFont(QFont("Courier New", 32, QFont.Bold))
+        self.title_label.setFont(retro_font(32, QFont.Bold))
         self.title_label.setStyleSheet("color: #E0E0E0; background: transparent;")
         self.title_label.setAlignment(Qt.AlignLeft)
         layout.addWidget(self.title_label)
@@ -79,7 +68,7 @@ class MenuView(QWidget):
         self.menu_labels = []
         for i, (name, _) in enumerate(self.MENU_ITEMS):
             label = QLabel()
-            label.setFont(QFont("Courier New", 24))
+            label.setFont(retro_font(24))
             label.setStyleSheet("color: #E0E0E0; background: transparent;")
             label.setAlignment(Qt.AlignLeft)
             label.setCursor(Qt.PointingHandCursor)
@@ -136,7 +125,7 @@ class MenuView(QWidget):
     def mousePressEvent(self, event):
         """Handle tap on empty area - go back to home."""
         # Only if not on a menu item
-        if not any(label.geometry().contains(event.pos()) for label in self.menu_labels):
+        if self.childAt(event.pos()) not in self.menu_labels:
             self.navigate(AppState.VIEW_HOME)
     
     def on_activate(self):
@@ -4,17 +4,32 @@ Text-based message list with arrow selection.
 """
 
 import logging
-import json
 from datetime import datetime
 from pathlib import Path
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QScrollArea
-from PyQt5.QtGui import QFont, QKeyEvent, QPainter, QColor
+from PyQt5.QtCore import Qt, QTimer, QFileSystemWatcher
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QStackedWidget
+from PyQt5.QtGui import QFont, QKeyEvent
+
+# Prefer orjson for message history (de)serialization, fall back to stdlib
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
 
 from models.app_state import AppState
+from ui.widgets.retro_font import retro_font
 
 logger = logging.getLogger(__name__)
 
+
 # Add VIEW_MENU to AppState if not present
 if not hasattr(AppState, 'VIEW_MENU'):
     AppState.VIEW_MENU = 'menu'
@@ -41,13 +56,34 @@ class MessagesView(QWidget):
         self.messages_file = Path("messages/message_history.json")
         
         self.messages = []
+        self._row_texts = []
+        self._row_font = retro_font(18)  # Shared by every list row
         self.selected_index = 0
         self.viewing_detail = False
-        self.current_message = None
+        
+        # Reload from disk only when the history file has changed
+        self._dirty = True
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._mark_dirty)
+        self._watcher.fileChanged.connect(self._mark_dirty)
+        self._watch_messages_file()
         
         self._init_ui()
         self.setFocusPolicy(Qt.StrongFocus)
     
+    def _watch_messages_file(self):
+        """Watch the history file and its directory for changes."""
+        watched = self._watcher.files() + self._watcher.directories()
+        for path in (self.messages_file.parent, self.messages_file):
+            if path.exists() and str(path) not in watched:
+                self._watcher.addPath(str(path))
+    
+    def _mark_dirty(self, path=None):
+        """Flag messages for reload on next activation."""
+        self._dirty = True
+        # Pick up a newly created (or replaced) history file
+        self._watch_messages_file()
+    
     def _init_ui(self):
         """Initialize UI components."""
         self.setStyleSheet("background-color: #000000;")
@@ -58,7 +94,7 @@ class MessagesView(QWidget):
         
         # Title
         self.title_label = QLabel("MESSAGES")
-        self.title_label.setFont(QFont("Courier New", 32, QFont.Bold))
+        self.title_label.setFont(retro_font(32, QFont.Bold))
         self.title_label.setStyleSheet("color: #E0E0E0; background: transparent;")
         self.title_label.setAlignment(Qt.AlignLeft)
         layout.addWidget(self.title_label)
@@ -67,7 +103,7 @@ class MessagesView(QWidget):
         
         # Separator
         self.separator = QLabel("─" * 50)
-        self.separator.setFont(QFont("Courier New", 14))
+        self.separator.setFont(retro_font(14))
         self.separator.setStyleSheet("color: #404040; background: transparent;")
         layout.addWidget(self.separator)
         
@@ -79,51 +115,54 @@ class MessagesView(QWidget):
         self.list_layout = QVBoxLayout(self.list_container)
         self.list_layout.setContentsMargins(0, 0, 0, 0)
         self.list_layout.setSpacing(10)
+        self.list_layout.setAlignment(Qt.AlignTop)
         
         # Placeholder for message labels
         self.message_labels = []
         
-        layout.addWidget(self.list_container)
-        layout.addStretch()
-        
-        # Detail view (hidden by default)
+        # Detail view
         self.detail_container = QWidget()
         self.detail_container.setStyleSheet("background: transparent;")
-        self.detail_container.hide()
         detail_layout = QVBoxLayout(self.detail_container)
         detail_layout.setContentsMargins(0, 0, 0, 0)
         detail_layout.setSpacing(15)
         
         self.detail_time = QLabel()
-        self.detail_time.setFont(QFont("Courier New", 14))
+        self.detail_time.setFont(retro_font(14))
         self.detail_time.setStyleSheet("color: #808080; background: transparent;")
         detail_layout.addWidget(self.detail_time)
         
         self.detail_title = QLabel()
-        self.detail_title.setFont(QFont("Courier New", 24, QFont.Bold))
+        self.detail_title.setFont(retro_font(24, QFont.Bold))
         self.detail_title.setStyleSheet("color: #E0E0E0; background: transparent;")
         self.detail_title.setWordWrap(True)
         detail_layout.addWidget(self.detail_title)
         
         self.detail_body = QLabel()
-        self.detail_body.setFont(QFont("Courier New", 16))
+        self.detail_body.setFont(retro_font(16))
         self.detail_body.setStyleSheet("color: #C0C0C0; background: transparent;")
         self.detail_body.setWordWrap(True)
         detail_layout.addWidget(self.detail_body)
         
         detail_layout.addStretch()
-        layout.addWidget(self.detail_container)
+        
+        # List and detail share one slot; switching pages avoids relayout
+        self.stack = QStackedWidget()
+        self.stack.setStyleSheet("background: transparent;")
+        self.stack.addWidget(self.list_container)
+        self.stack.addWidget(self.detail_container)
+        layout.addWidget(self.stack, 1)
         
         # Hint at bottom
         self.hint_label = QLabel("[TAP] View   [BACK] Menu")
-        self.hint_label.setFont(QFont("Courier New", 14))
+        self.hint_label.setFont(retro_font(14))
         self.hint_label.setStyleSheet("color: #606060; background: transparent;")
         self.hint_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.hint_label)
         
         # Empty state
         self.empty_label = QLabel("No messages")
-        self.empty_label.setFont(QFont("Courier New", 18))
+        self.empty_label.setFont(self._row_font)
         self.empty_label.setStyleSheet("color: #606060; background: transparent;")
         self.empty_label.setAlignment(Qt.AlignCenter)
         self.empty_label.hide()
@@ -135,63 +174,76 @@ class MessagesView(QWidget):
         
         try:
             if self.messages_file.exists():
-                with open(self.messages_file, 'r') as f:
-                    data = json.load(f)
-                    self.messages = data if isinstance(data, list) else []
+                data = _loads(self.messages_file.read_bytes())
+                self.messages = data if isinstance(data, list) else []
         except Exception as e:
             logger.error(f"Failed to load messages: {e}")
         
-        self._update_display()
-    
-    def _update_display(self):
-        """Update the message list display."""
-        # Clear existing labels
-        for label in self.message_labels:
-            label.deleteLater()
-        self.message_labels = []
-        
-        if not self.messages:
-            self.empty_label.show()
-            return
-        
-        self.empty_label.hide()
+        # Newest first - ISO-8601 timestamps sort correctly as strings
+        self.messages.sort(key=lambda m: m.get('timestamp') or '', reverse=True)
         
-        for i, msg in enumerate(self.messages[:15]):  # Show max 15
-            label = QLabel()
-            label.setFont(QFont("Courier New", 18))
-            label.setCursor(Qt.PointingHandCursor)
-            label.mousePressEvent = lambda e, idx=i: self._select_message(idx)
-            
-            # Format: "▶ HH:MM Title" or "  HH:MM Title"
-            timestamp = msg.get('timestamp', '')
+        # Build "HH:MM Title" row text once here rather than on every redraw
+        self._row_texts = []
+        for msg in self.messages:
             try:
-                dt = datetime.fromisoformat(timestamp)
-                time_str = dt.strftime("%H:%M")
+                time_str = datetime.fromisoformat(msg.get('timestamp', '')).strftime("%H:%M")
             except:
                 time_str = "??:??"
             
             title = msg.get('title', msg.get('text', 'Message'))
             if len(title) > 40:
                 title = title[:37] + "..."
+            self._row_texts.append(f"{time_str} {title}")
+        
+        self._update_display()
+    
+    def _update_display(self):
+        """Update the message list display."""
+        # Batch all label changes into a single repaint
+        self.list_container.setUpdatesEnabled(False)
+        try:
+            # Clear existing labels (empty_label is built once and only toggled)
+            for label in self.message_labels:
+                self.list_layout.removeWidget(label)
+                label.deleteLater()
+            self.message_labels = []
             
-            # Check if unread
-            is_unread = not msg.get('read', True)
-            
-            if i == self.selected_index:
-                text = f"▶ {time_str} {title}"
-                style = "color: #FFFFFF; background: transparent;"
-            else:
-                text = f"  {time_str} {title}"
-                if is_unread:
-                    style = "color: #90FF90; background: transparent;"  # Green for unread
-                else:
-                    style = "color: #808080; background: transparent;"
+            if not self.messages:
+                self.empty_label.show()
+                return
             
-            label.setText(text)
-            label.setStyleSheet(style)
+            self.empty_label.hide()
             
-            self.message_labels.append(label)
-            self.list_layout.addWidget(label)
+            for i, msg in enumerate(self.messages[:15]):  # Show max 15
+                label = QLabel()
+                label.setFont(self._row_font)
+                label.setCursor(Qt.PointingHandCursor)
+                label.mousePressEvent = lambda e, idx=i: self._select_message(idx)
+                
+                # Format: "▶ HH:MM Title" or "  HH:MM Title"
+                row_text = self._row_texts[i]
+                
+                # Check if unread
+                is_unread = not msg.get('read', True)
+                
+                if i == self.selected_index:
+                    text = f"▶ {row_text}"
+                    style = "color: #FFFFFF; background: transparent;"
+                else:
+                    text = f"  {row_text}"
+                    if is_unread:
+                        style = "color: #90FF90; background: transparent;"  # Green for unread
+                    else:
+                        style = "color: #808080; background: transparent;"
+                
+                label.setText(text)
+                label.setStyleSheet(style)
+                
+                self.message_labels.append(label)
+                self.list_layout.addWidget(label)
+        finally:
+            self.list_container.setUpdatesEnabled(True)
+            self.list_container.update()
     
     def _select_message(self, index: int):
         """Select and view a message."""
@@ -205,7 +257,6 @@ class MessagesView(QWidget):
             return
         
         msg = self.messages[self.selected_index]
-        self.current_message = msg
         self.viewing_detail = True
         
         # Update detail labels
@@ -225,8 +276,7 @@ class MessagesView(QWidget):
         self._save_messages()
         
         # Switch to detail view
-        self.list_container.hide()
-        self.detail_container.show()
+        self.stack.setCurrentWidget(self.detail_container)
         self.title_label.setText("MESSAGE")
         self.hint_label.setText("[BACK] Return to list")
         
@@ -235,10 +285,8 @@ class MessagesView(QWidget):
     def _show_list(self):
         """Return to message list."""
         self.viewing_detail = False
-        self.current_message = None
         
-        self.detail_container.hide()
-        self.list_container.show()
+        self.stack.setCurrentWidget(self.list_container)
         self.title_label.setText("MESSAGES")
         self.hint_label.setText("[TAP] View   [BACK] Menu")
         
@@ -248,8 +296,7 @@ class MessagesView(QWidget):
         """Save messages to file."""
         try:
             self.messages_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.messages_file, 'w') as f:
-                json.dump(self.messages, f, indent=2)
+            self.messages_file.write_bytes(_dumps(self.messages))
         except Exception as e:
             logger.error(f"Failed to save messages: {e}")
     
@@ -288,9 +335,8 @@ class MessagesView(QWidget):
     def mousePressEvent(self, event):
         """Handle tap outside message items."""
         # Check if clicked on a message label
-        for i, label in enumerate(self.message_labels):
-            if label.geometry().contains(event.pos()):
-                return  # Let the label handle it
+        if self.childAt(event.pos()) in self.message_labels:
+            return  # Let the label handle it
         
         # Tap outside goes back
         self._go_back()
@@ -300,7 +346,9 @@ class MessagesView(QWidget):
         logger.debug("Messages view activated")
         self.selected_index = 0
         self.viewing_detail = False
-        self._load_messages()
+        if self._dirty:
+            self._dirty = False
+            self._load_messages()
         self._show_list()
         self.setFocus()
     
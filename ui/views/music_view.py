@@ -5,9 +5,18 @@ Locked layout music player with search, transport, volume, and dancing bars.
 
 import logging
 import random
-from PyQt5.QtCore import Qt, QTimer, QRectF
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit
-from PyQt5.QtGui import QFont, QPainter, QPen, QBrush, QColor, QKeyEvent
+from PyQt5.QtCore import Qt, QTimer, QRect, QPoint, QPointF
+from PyQt5.QtWidgets import QWidget, QApplication
+from PyQt5.QtGui import (
+    QFont, QFontMetrics, QPainter, QPen, QBrush, QColor, QKeyEvent, QPixmap, QPolygon,
+    QStaticText, QTransform
+)
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 from models.app_state import AppState
 from services.music_service import MusicService
@@ -41,6 +50,64 @@ class MusicView(QWidget):
     # Volume steps (discrete)
     VOLUME_STEPS = 10
     
+    # Screen sections with changing content (locked layout) - paintEvent
+    # skips those outside the dirty region. Static chrome is one pixmap.
+    SEARCH_BOX_RECT = QRect(60, 50, 400, 45)
+    TRANSPORT_RECT = QRect(59, 152, 263, 90)
+    VOLUME_RECT = QRect(60, 272, 292, 70)
+    TRACK_RECT = QRect(400, 175, 624, 125)
+    BARS_RECT = QRect(400, 352, 230, 110)
+    
+    # Section origins (locked layout)
+    TRANSPORT_POS = (60, 180)
+    VOLUME_POS = (60, 300)
+    BACK_POS = (60, 420)
+    BARS_POS = (400, 380)
+    
+    KEYBOARD_HEIGHT = 280
+    
+    # Visualizer bars - heights are levels 2..8, scaled to pixels
+    BAR_COUNT = 8
+    BAR_WIDTH = 20
+    BAR_SPACING = 8
+    BAR_MAX_HEIGHT = 80
+    BAR_SCALE = BAR_MAX_HEIGHT // 8
+    
+    # Paint resources, shared instead of rebuilt by every draw call
+    _BRUSH_BACKGROUND = QBrush(QColor(0, 0, 0))
+    _BRUSH_SEARCH_BOX = QBrush(QColor(16, 16, 16))
+    _PEN_SEARCH_BOX = QPen(QColor(64, 64, 64), 2)
+    _PEN_SEARCH_BOX_ACTIVE = QPen(QColor(128, 128, 128), 2)  # While the keyboard is up
+    _COL_TEXT = QColor(224, 224, 224)
+    _COL_LABEL = QColor(160, 160, 160)
+    _COL_SEARCH_TEXT = _COL_TEXT
+    _COL_SEARCH_PLACEHOLDER = QColor(112, 112, 112)
+    _PEN_BUTTON = QPen(QColor(128, 128, 128), 2)
+    _BRUSH_BUTTON = QBrush(QColor(30, 30, 30))
+    _PEN_VOL_BAR = QPen(QColor(80, 80, 80), 2)
+    _BRUSH_VOL_BAR = QBrush(QColor(20, 20, 20))
+    _BRUSH_VOL_ON = QBrush(QColor(200, 200, 180))  # Filled volume block
+    _BRUSH_VOL_OFF = QBrush(QColor(40, 40, 40))  # Empty volume block
+    _PEN_BACK = QPen(QColor(100, 100, 100), 2)
+    _COL_BACK_TEXT = QColor(180, 180, 180)
+    _COL_TRACK_TITLE = QColor(240, 240, 230)
+    _COL_TRACK_ARTIST = QColor(160, 160, 150)
+    _COL_STATUS_PLAYING = QColor(100, 200, 100)
+    _COL_STATUS_WAITING = QColor(200, 200, 100)  # Searching / paused
+    _COL_STATUS_STOPPED = QColor(150, 150, 150)
+    _COL_BARS_LABEL = QColor(100, 100, 100)
+    _BRUSH_BAR_ACTIVE = QBrush(QColor(150, 220, 150))  # Green-ish
+    _BRUSH_BAR_IDLE = QBrush(QColor(80, 80, 80))  # Gray
+    _BRUSH_KEYBOARD = QBrush(QColor(0, 0, 0, 230))  # Semi-transparent overlay
+    _PEN_KEYBOARD_EDGE = QPen(QColor(80, 80, 80), 2)
+    _PEN_KEY = QPen(QColor(100, 100, 100), 1)
+    _COL_KEY_TEXT = QColor(240, 240, 240)
+    _COL_KEY = QColor(60, 60, 60)
+    _COL_KEY_CAPS_ON = QColor(100, 150, 100)
+    _COL_KEY_BACKSPACE = QColor(120, 80, 80)
+    _COL_KEY_SEARCH = QColor(80, 120, 80)
+    _COL_KEY_CLOSE = QColor(120, 60, 60)
+    
     # Keyboard layout for search
     KEYBOARD_ROWS = [
         ['1', '2', '3', '4', '5', '6', '7', '8', '9', '0'],
@@ -58,54 +125,157 @@ class MusicView(QWidget):
         self.volume_level = app_state.get_setting('volume', 70) // 10  # 0-10
         self.is_playing = False
         self.is_paused = False
+        self.inflight_query = None  # Normalized query being searched (cleared by search_completed)
+        self._search_text = ''  # Text in the search box, as typed
+        self.search_query = ''  # Stripped search text, kept in sync by _set_search_text
         self.current_track = {'title': 'No track', 'artist': ''}
         self.bar_heights = [3, 5, 4, 6, 3, 5, 4, 6]  # Dancing bars
+        # Private generator for the bar animation - NumPy draws all bars in one call
+        self._rng = np.random.default_rng() if NUMPY_AVAILABLE else random.Random()
         self.keyboard_visible = False  # Native on-screen keyboard visibility
         self.caps_lock = False  # Caps lock state
+        self._chrome_pixmap = None  # Static labels/outlines, built on first paint
+        self._kb_pixmaps = {}  # caps_lock -> pre-rendered keyboard panel
         
+        self._init_fonts()
+        self._init_static_text()
+        self._init_icons()
         self._init_ui()
         self._init_timers()
-        
-        # Listen for music state updates
-        app_state.register_callback('music_state_changed', self._on_music_state_changed)
-        app_state.register_callback('track_changed', self._on_track_changed)
+        self._recompute_geometry()
+        self._elide_track_info()
+        
+        # Listen for music state updates (unregistered in closeEvent; held
+        # weakly so a discarded view can still be collected)
+        self._app_callbacks = [
+            ('music_state_changed', self._on_music_state_changed),
+            ('track_changed', self._on_track_changed),
+            ('search_completed', self._on_search_completed),
+        ]
+        for event, callback in self._app_callbacks:
+            app_state.register_callback(event, callback, weak=True)
+    
+    def _init_fonts(self):
+        """Build fonts once instead of on every paint."""
+        self._font_title = QFont("Courier New", 28, QFont.Bold)
+        self._font_artist = QFont("Courier New", 18)
+        self._font_vol_ctrl = QFont("Courier New", 20)
+        self._font_vol = QFont("Courier New", 16)
+        self._font_text = QFont("Courier New", 14)
+        self._font_label = QFont("Courier New", 12)
+        self._font_key = QFont("Courier New", 14, QFont.Bold)
+        self._font_key_small = QFont("Courier New", 10, QFont.Bold)
+        self._title_fm = QFontMetrics(self._font_title)
+        self._artist_fm = QFontMetrics(self._font_artist)
+    
+    def _init_static_text(self):
+        """Lay out the fixed labels once - drawStaticText skips per-paint shaping."""
+        self._static_labels = {}
+        for key, text, font in (
+            ('title', "MUSIC", self._font_title),
+            ('search', "SEARCH:", self._font_text),
+            ('transport', "TRANSPORT", self._font_label),
+            ('volume', "VOLUME", self._font_label),
+            ('vol', "VOL", self._font_vol),
+            ('vol_down', "−", self._font_vol_ctrl),
+            ('vol_up', "+", self._font_vol_ctrl),
+            ('back', "← BACK", self._font_text),
+            ('visualizer', "VISUALIZER", self._font_label),
+        ):
+            static = QStaticText(text)
+            static.setTextFormat(Qt.PlainText)
+            static.prepare(QTransform(), font)
+            self._static_labels[key] = (static, font, QFontMetrics(font).ascent())
+    
+    def _draw_label(self, painter, key, x, baseline):
+        """Draw a static label with its baseline at y, like drawText(x, y, text)."""
+        static, font, ascent = self._static_labels[key]
+        painter.setFont(font)
+        painter.drawStaticText(x, baseline - ascent, static)
+    
+    def _draw_label_centered(self, painter, key, rect):
+        """Draw a static label centered in rect."""
+        static, font, _ = self._static_labels[key]
+        size = static.size()
+        center = rect.center()
+        painter.setFont(font)
+        painter.drawStaticText(
+            QPointF(center.x() - size.width() / 2, center.y() - size.height() / 2),
+            static
+        )
+    
+    def _init_icons(self):
+        """
+        Pre-render transport glyphs as pixmaps.
+        
+        The ⏮ ⏯ ⏭ characters need a fallback font on the Pi, which meant a
+        font-substitution lookup on every paint.
+        """
+        size = 28
+        
+        def render(*shapes):
+            pixmap = QPixmap(size, size)
+            pixmap.fill(Qt.transparent)
+            p = QPainter(pixmap)
+            p.setRenderHint(QPainter.Antialiasing)
+            p.setPen(Qt.NoPen)
+            p.setBrush(QColor(224, 224, 224))
+            for shape in shapes:
+                if isinstance(shape, QPolygon):
+                    p.drawPolygon(shape)
+                else:
+                    p.drawRect(*shape)
+            p.end()
+            return pixmap
+        
+        def triangle(*points):
+            return QPolygon([QPoint(x, y) for x, y in points])
+        
+        self._icon_play = render(triangle((7, 4), (23, 14), (7, 24)))
+        self._icon_pause = render((6, 4, 6, 20), (16, 4, 6, 20))
+        self._icon_prev = render((4, 5, 3, 18), triangle((23, 5), (8, 14), (23, 23)))
+        self._icon_next = render(triangle((5, 5), (20, 14), (5, 23)), (21, 5, 3, 18))
     
     def _init_ui(self):
         """Initialize UI components."""
-        self.setStyleSheet("background-color: #000000;")
+        # paintEvent fills its own black background, so Qt can skip erasing
+        # the widget first (and no stylesheet polish on every paint)
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+        self.setAutoFillBackground(False)
         self.setFocusPolicy(Qt.StrongFocus)
         
-        # We'll use custom painting for the retro look
-        # But need a search input
-        
-        # Create search input (positioned via paintEvent/geometry)
-        self.search_input = QLineEdit(self)
-        self.search_input.setPlaceholderText("Search...")
-        self.search_input.setFont(QFont("Courier New", 16))
-        self.search_input.setStyleSheet("""
-            QLineEdit {
-                background-color: #101010;
-                color: #E0E0E0;
-                border: 2px solid #404040;
-                padding: 8px 12px;
-                font-family: 'Courier New';
-            }
-            QLineEdit:focus {
-                border-color: #808080;
-            }
-        """)
-        self.search_input.setGeometry(60, 50, 400, 45)
-        self.search_input.returnPressed.connect(self._search_and_play)
-        # Ensure search input gets focus on click
-        self.search_input.setFocusPolicy(Qt.ClickFocus)
-        # Make search input read-only to prevent system keyboard
-        self.search_input.setReadOnly(True)
-        self.search_input.mousePressEvent = self._on_search_input_clicked
-        
-    def _on_search_input_clicked(self, event):
-        """Handle click on search input to show native keyboard."""
+        # Search box is painted too (see _draw_search_box); taps on it open
+        # the native keyboard, which edits _search_text directly
+        self._search_metrics = QFontMetrics(self._font_vol)
+    
+    def _set_search_text(self, text):
+        """Replace the search text and repaint just the search box."""
+        # Deliberately no search-as-you-type: every search starts playback,
+        # so only SEARCH / Enter submit (one service call per query)
+        self._search_text = text
+        self.search_query = text.strip()
+        self.update(self.SEARCH_BOX_RECT)
+    
+    def _on_search_box_clicked(self):
+        """Handle click on the search box to show native keyboard."""
+        self._show_keyboard()
+    
+    def _show_keyboard(self):
+        """Open the on-screen keyboard (repeat calls are no-ops)."""
+        if self.keyboard_visible:
+            return
         self.keyboard_visible = True
-        self.update()
+        self.update(self._keyboard_rect())
+        self.update(self.SEARCH_BOX_RECT)  # Active border
+    
+    def _hide_keyboard(self):
+        """Close the on-screen keyboard, repainting only what it covered."""
+        if not self.keyboard_visible:
+            return
+        self.keyboard_visible = False
+        self.update(self._keyboard_rect())
+        self.update(self.SEARCH_BOX_RECT)
     
     def _init_timers(self):
         """Initialize timers."""
@@ -113,293 +283,401 @@ class MusicView(QWidget):
         self.bars_timer = QTimer()
         self.bars_timer.timeout.connect(self._update_bars)
         
-        # Repaint timer
-        self.repaint_timer = QTimer()
-        self.repaint_timer.timeout.connect(self.update)
-        self.repaint_timer.start(100)
+        # Volume commit timer - coalesces rapid volume steps into one write
+        self.volume_commit_timer = QTimer(self)
+        self.volume_commit_timer.setSingleShot(True)
+        self.volume_commit_timer.setInterval(120)
+        self.volume_commit_timer.timeout.connect(self._commit_volume)
+        
+        # Pause the animation while the app is in the background
+        app = QApplication.instance()
+        if app is not None:
+            app.applicationStateChanged.connect(self._on_application_state_changed)
+        
+        # No free-running repaint timer: every state change calls update()
+        # itself, and bars_timer only runs while music is playing. Always
+        # update(), never repaint() - Qt merges queued updates so a compound
+        # change paints once per event-loop turn.
     
     def _update_bars(self):
         """Update dancing bar heights (fake animation)."""
         if self.is_playing and not self.is_paused:
             # Random heights for fake visualization
-            self.bar_heights = [random.randint(2, 8) for _ in range(8)]
+            if NUMPY_AVAILABLE:
+                # tolist() once here so painting gets plain ints
+                self.bar_heights = self._rng.integers(2, 9, size=self.BAR_COUNT).tolist()
+            else:
+                # One RNG call for all bars: 3 random bits per bar (0-7),
+                # scaled onto levels 2-8
+                bits = self._rng.getrandbits(3 * self.BAR_COUNT)
+                self.bar_heights = [
+                    2 + (((bits >> shift) & 7) * 7 >> 3)
+                    for shift in range(0, 3 * self.BAR_COUNT, 3)
+                ]
         else:
             # Flat when paused/stopped
-            self.bar_heights = [2] * 8
-        self.update()
+            self.bar_heights = [2] * self.BAR_COUNT
+        # Only the visualizer moved - leave the rest of the view alone
+        self.update(self.BARS_RECT)
+    
+    def _recompute_geometry(self):
+        """
+        Compute every hit/draw rect for the current size.
+        
+        Called from __init__ and resizeEvent only - painting just reads
+        these, and clicks work before the first paint. Axis-aligned buttons
+        use integer QRect so they rasterize exactly.
+        """
+        w, h = self.width(), self.height()
+        
+        # Transport buttons
+        x, y = self.TRANSPORT_POS
+        btn_w, btn_h = 80, 60
+        spacing = 10
+        self._prev_rect = QRect(x, y, btn_w, btn_h)
+        self._play_rect = QRect(x + btn_w + spacing, y, btn_w, btn_h)
+        self._next_rect = QRect(x + 2 * (btn_w + spacing), y, btn_w, btn_h)
+        
+        # Volume bar and -/+ controls
+        x, y = self.VOLUME_POS
+        bar_x, bar_w, bar_h = x + 60, 200, 30
+        self._vol_down_rect = QRect(bar_x - 30, y, 30, bar_h + 10)
+        self._vol_up_rect = QRect(bar_x + bar_w, y, 30, bar_h + 10)
+        self._vol_bar_rect = QRect(bar_x, y + 5, bar_w, bar_h)
+        block_w = bar_w // self.VOLUME_STEPS
+        self._vol_block_rects = [
+            QRect(bar_x + i * block_w + 2, y + 7, block_w - 4, bar_h - 4)
+            for i in range(self.VOLUME_STEPS)
+        ]
+        
+        # Dancing bars - fixed x positions and baseline, heights vary per frame
+        x, y = self.BARS_POS
+        bar_pitch = self.BAR_WIDTH + self.BAR_SPACING
+        self._bar_xs = [x + i * bar_pitch for i in range(self.BAR_COUNT)]
+        self._bar_base_y = y + self.BAR_MAX_HEIGHT
+        
+        # Back button
+        x, y = self.BACK_POS
+        self._back_rect = QRect(x, y, 100, 50)
+        
+        # Keyboard
+        key_w = key_h = 45
+        spacing = 5
+        keyboard_y = h - self.KEYBOARD_HEIGHT
+        start_y = keyboard_y + 15
+        
+        # Letter/number rows - a uniform grid, hit-tested arithmetically
+        row_starts = []
+        self._letter_key_rects = []
+        for row_idx, row in enumerate(self.KEYBOARD_ROWS):
+            row_width = len(row) * (key_w + spacing) - spacing
+            start_x = (w - row_width) // 2
+            row_starts.append(start_x)
+            y = start_y + row_idx * (key_h + spacing)
+            for col_idx, letter in enumerate(row):
+                x = start_x + col_idx * (key_w + spacing)
+                self._letter_key_rects.append((letter, QRect(x, y, key_w, key_h)))
+        self._kb_grid = (row_starts, start_y, key_w, key_h, spacing)
+        
+        # Bottom row: CAPS, SPACE, BACKSPACE, SEARCH
+        bottom_y = start_y + 4 * (key_h + spacing)
+        total_bottom_width = 70 + spacing + 200 + spacing + 70 + spacing + 100
+        caps_x = (w - total_bottom_width) // 2
+        space_x = caps_x + 70 + spacing
+        back_x = space_x + 200 + spacing
+        search_x = back_x + 70 + spacing
+        self._caps_rect = QRect(caps_x, bottom_y, 70, key_h)
+        self._space_rect = QRect(space_x, bottom_y, 200, key_h)
+        self._backspace_rect = QRect(back_x, bottom_y, 70, key_h)
+        self._search_btn_rect = QRect(search_x, bottom_y, 100, key_h)
+        
+        # Close keyboard button (X) at top right of keyboard
+        self._close_kb_rect = QRect(w - 50, keyboard_y + 10, 40, 35)
     
     def paintEvent(self, event):
-        """Paint the music interface."""
-        super().paintEvent(event)
+        """Paint the music interface, skipping sections outside the dirty region."""
+        # A stray update() while hidden/obscured has nothing to draw
+        if not self.isVisible() or self.visibleRegion().isEmpty():
+            return
         
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        if self._chrome_pixmap is None:
+            self._chrome_pixmap = self._render_chrome()
         
-        w, h = self.width(), self.height()
+        painter = QPainter(self)
+        # Opaque widget - the static chrome doubles as the background
+        rect = event.rect()
+        painter.drawPixmap(rect, self._chrome_pixmap, rect)
+        # Everything here is axis-aligned rects - only text needs smoothing
+        painter.setRenderHint(QPainter.TextAntialiasing)
         
-        # Title
-        painter.setPen(QColor(224, 224, 224))
-        font = QFont("Courier New", 28, QFont.Bold)
-        painter.setFont(font)
-        painter.drawText(60, 35, "MUSIC")
+        region = event.region()
         
-        # Search label
-        painter.setPen(QColor(160, 160, 160))
-        font = QFont("Courier New", 14)
-        painter.setFont(font)
-        painter.drawText(60, 120, "SEARCH:")
+        # Search box
+        if region.intersects(self.SEARCH_BOX_RECT):
+            self._draw_search_box(painter)
         
-        # Left column (transport, volume)
-        self._draw_transport(painter, 60, 180)
-        self._draw_volume(painter, 60, 300)
-        self._draw_back_button(painter, 60, 420)
+        # Left column (play/pause state, volume level)
+        if region.intersects(self.TRANSPORT_RECT):
+            play_icon = self._icon_pause if (self.is_playing and not self.is_paused) else self._icon_play
+            self._draw_icon(painter, self._play_rect, play_icon)
+        if region.intersects(self.VOLUME_RECT):
+            self._draw_volume_level(painter)
         
         # Right column (track info, bars)
-        self._draw_track_info(painter, 400, 180)
-        self._draw_dancing_bars(painter, 400, 380)
+        if region.intersects(self.TRACK_RECT):
+            self._draw_track_info(painter, 400, 180)
+        if region.intersects(self.BARS_RECT):
+            self._draw_dancing_bars(painter)
         
         # Draw native keyboard if visible
-        if self.keyboard_visible:
+        if self.keyboard_visible and region.intersects(self._keyboard_rect()):
             self._draw_keyboard(painter)
     
-    def _draw_transport(self, painter, x, y):
-        """Draw transport buttons."""
-        painter.setPen(QColor(160, 160, 160))
-        font = QFont("Courier New", 12)
-        painter.setFont(font)
-        painter.drawText(x, y - 10, "TRANSPORT")
+    def _render_chrome(self):
+        """Render everything that never changes (labels, outlines, icons) into a pixmap."""
+        pixmap = QPixmap(self.size())
         
-        # Button dimensions
-        btn_w, btn_h = 80, 60
-        spacing = 10
+        painter = QPainter(pixmap)
+        painter.fillRect(pixmap.rect(), self._BRUSH_BACKGROUND)
+        painter.setRenderHint(QPainter.TextAntialiasing)
         
-        # Previous button
-        self._prev_rect = QRectF(x, y, btn_w, btn_h)
-        self._draw_button(painter, self._prev_rect, "⏮")
-        
-        # Play/Pause button
-        self._play_rect = QRectF(x + btn_w + spacing, y, btn_w, btn_h)
-        play_symbol = "⏸" if (self.is_playing and not self.is_paused) else "▶"
-        self._draw_button(painter, self._play_rect, play_symbol)
+        # Title
+        painter.setPen(self._COL_TEXT)
+        self._draw_label(painter, 'title', 60, 35)
         
-        # Next button
-        self._next_rect = QRectF(x + 2 * (btn_w + spacing), y, btn_w, btn_h)
-        self._draw_button(painter, self._next_rect, "⏭")
+        # Search label
+        painter.setPen(self._COL_LABEL)
+        self._draw_label(painter, 'search', 60, 120)
+        
+        # Left column (transport, volume, back)
+        self._draw_transport(painter)
+        self._draw_volume(painter)
+        self._draw_back_button(painter)
+        
+        # Visualizer label
+        painter.setPen(self._COL_BARS_LABEL)
+        self._draw_label(painter, 'visualizer', 400, 370)
+        
+        painter.end()
+        return pixmap
+    
+    def _keyboard_rect(self):
+        """Area covered by the on-screen keyboard."""
+        return QRect(0, self.height() - self.KEYBOARD_HEIGHT, self.width(), self.KEYBOARD_HEIGHT)
+    
+    def _draw_search_box(self, painter):
+        """Draw the search box with the current text (or placeholder)."""
+        rect = self.SEARCH_BOX_RECT
+        painter.setPen(self._PEN_SEARCH_BOX_ACTIVE if self.keyboard_visible else self._PEN_SEARCH_BOX)
+        painter.setBrush(self._BRUSH_SEARCH_BOX)
+        painter.drawRect(rect.adjusted(1, 1, -1, -1))
+        
+        text_rect = rect.adjusted(14, 2, -14, -2)  # Border + 12px padding
+        if self._search_text:
+            painter.setPen(self._COL_SEARCH_TEXT)
+            # Keep the end of a long query visible, like a scrolled line edit
+            text = self._search_metrics.elidedText(
+                self._search_text, Qt.ElideLeft, text_rect.width()
+            )
+        else:
+            painter.setPen(self._COL_SEARCH_PLACEHOLDER)
+            text = "Search..."
+        painter.setFont(self._font_vol)
+        painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter, text)
     
-    def _draw_button(self, painter, rect, text):
-        """Draw a retro button."""
-        painter.setPen(QPen(QColor(128, 128, 128), 2))
-        painter.setBrush(QBrush(QColor(30, 30, 30)))
+    def _draw_transport(self, painter):
+        """Draw transport buttons."""
+        x, y = self.TRANSPORT_POS
+        painter.setPen(self._COL_LABEL)
+        self._draw_label(painter, 'transport', x, y - 10)
+        
+        self._draw_button(painter, self._prev_rect, self._icon_prev)
+        # Play/Pause icon depends on state - drawn by paintEvent
+        self._draw_button(painter, self._play_rect)
+        self._draw_button(painter, self._next_rect, self._icon_next)
+    
+    def _draw_button(self, painter, rect, icon=None):
+        """Draw a retro button, with a pre-rendered icon if given."""
+        painter.setPen(self._PEN_BUTTON)
+        painter.setBrush(self._BRUSH_BUTTON)
         painter.drawRect(rect)
-        
-        painter.setPen(QColor(224, 224, 224))
-        font = QFont("Courier New", 24)
-        painter.setFont(font)
-        painter.drawText(rect, Qt.AlignCenter, text)
-    
-    def _draw_volume(self, painter, x, y):
-        """Draw volume control with discrete steps."""
-        painter.setPen(QColor(160, 160, 160))
-        font = QFont("Courier New", 12)
-        painter.setFont(font)
-        painter.drawText(x, y - 10, "VOLUME")
+        if icon is not None:
+            self._draw_icon(painter, rect, icon)
+    
+    def _draw_icon(self, painter, rect, icon):
+        """Draw a pre-rendered icon centered in rect."""
+        painter.drawPixmap(
+            int(rect.x() + (rect.width() - icon.width()) / 2),
+            int(rect.y() + (rect.height() - icon.height()) / 2),
+            icon
+        )
+    
+    def _draw_volume(self, painter):
+        """Draw the static parts of the volume control."""
+        x, y = self.VOLUME_POS
+        painter.setPen(self._COL_LABEL)
+        self._draw_label(painter, 'volume', x, y - 10)
         
         # VOL label
-        painter.setPen(QColor(224, 224, 224))
-        font = QFont("Courier New", 16)
-        painter.setFont(font)
-        painter.drawText(x, y + 25, "VOL")
-        
-        # Volume bar
-        bar_x = x + 60
-        bar_w = 200
-        bar_h = 30
-        
-        # Background
-        painter.setPen(QPen(QColor(80, 80, 80), 2))
-        painter.setBrush(QBrush(QColor(20, 20, 20)))
-        painter.drawRect(bar_x, y + 5, bar_w, bar_h)
-        
-        # Filled blocks (discrete steps)
-        block_w = bar_w // self.VOLUME_STEPS
-        painter.setPen(Qt.NoPen)
-        for i in range(self.VOLUME_STEPS):
-            if i < self.volume_level:
-                painter.setBrush(QBrush(QColor(200, 200, 180)))  # Filled
-            else:
-                painter.setBrush(QBrush(QColor(40, 40, 40)))  # Empty
-            painter.drawRect(bar_x + i * block_w + 2, y + 7, block_w - 4, bar_h - 4)
+        painter.setPen(self._COL_TEXT)
+        self._draw_label(painter, 'vol', x, y + 25)
         
-        # Store rect for click detection
-        self._vol_down_rect = QRectF(bar_x - 30, y, 30, bar_h + 10)
-        self._vol_up_rect = QRectF(bar_x + bar_w, y, 30, bar_h + 10)
-        self._vol_bar_rect = QRectF(bar_x, y + 5, bar_w, bar_h)
+        # Volume bar background
+        painter.setPen(self._PEN_VOL_BAR)
+        painter.setBrush(self._BRUSH_VOL_BAR)
+        painter.drawRect(self._vol_bar_rect)
         
         # Volume controls
-        painter.setPen(QColor(160, 160, 160))
-        font = QFont("Courier New", 20)
-        painter.setFont(font)
-        painter.drawText(self._vol_down_rect, Qt.AlignCenter, "−")
-        painter.drawText(self._vol_up_rect, Qt.AlignCenter, "+")
+        painter.setPen(self._COL_LABEL)
+        self._draw_label_centered(painter, 'vol_down', self._vol_down_rect)
+        self._draw_label_centered(painter, 'vol_up', self._vol_up_rect)
     
-    def _draw_back_button(self, painter, x, y):
+    def _draw_volume_level(self, painter):
+        """Draw the volume blocks (discrete steps) inside the volume bar."""
+        # One batched call per run
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self._BRUSH_VOL_ON)
+        painter.drawRects(self._vol_block_rects[:self.volume_level])
+        painter.setBrush(self._BRUSH_VOL_OFF)
+        painter.drawRects(self._vol_block_rects[self.volume_level:])
+    
+    def _draw_back_button(self, painter):
         """Draw back button."""
-        self._back_rect = QRectF(x, y, 100, 50)
-        
-        painter.setPen(QPen(QColor(100, 100, 100), 2))
-        painter.setBrush(QBrush(QColor(30, 30, 30)))
+        painter.setPen(self._PEN_BACK)
+        painter.setBrush(self._BRUSH_BUTTON)
         painter.drawRect(self._back_rect)
         
-        painter.setPen(QColor(180, 180, 180))
-        font = QFont("Courier New", 14)
-        painter.setFont(font)
-        painter.drawText(self._back_rect, Qt.AlignCenter, "← BACK")
+        painter.setPen(self._COL_BACK_TEXT)
+        self._draw_label_centered(painter, 'back', self._back_rect)
     
     def _draw_track_info(self, painter, x, y):
         """Draw track name and artist."""
         # Song title (large)
-        painter.setPen(QColor(240, 240, 230))
-        font = QFont("Courier New", 28, QFont.Bold)
-        painter.setFont(font)
+        painter.setPen(self._COL_TRACK_TITLE)
+        painter.setFont(self._font_title)
         
-        title = self.current_track.get('title', 'No track')
-        # Truncate if too long
-        if len(title) > 25:
-            title = title[:22] + "..."
-        painter.drawText(x, y + 30, title)
+        painter.drawText(x, y + 30, self._elided_title)
         
         # Artist (smaller)
-        painter.setPen(QColor(160, 160, 150))
-        font = QFont("Courier New", 18)
-        painter.setFont(font)
-        
-        artist = self.current_track.get('artist', '')
-        if len(artist) > 30:
-            artist = artist[:27] + "..."
-        painter.drawText(x, y + 70, artist)
+        painter.setPen(self._COL_TRACK_ARTIST)
+        painter.setFont(self._font_artist)
+        painter.drawText(x, y + 70, self._elided_artist)
         
         # Status indicator
-        if self.is_playing:
+        if self.inflight_query is not None:
+            status = "» SEARCHING..."
+            color = self._COL_STATUS_WAITING
+        elif self.is_playing:
             status = "▶ PLAYING" if not self.is_paused else "⏸ PAUSED"
-            color = QColor(100, 200, 100) if not self.is_paused else QColor(200, 200, 100)
+            color = self._COL_STATUS_PLAYING if not self.is_paused else self._COL_STATUS_WAITING
         else:
             status = "■ STOPPED"
-            color = QColor(150, 150, 150)
+            color = self._COL_STATUS_STOPPED
         
         painter.setPen(color)
-        font = QFont("Courier New", 12)
-        painter.setFont(font)
+        painter.setFont(self._font_label)
         painter.drawText(x, y + 110, status)
     
-    def _draw_dancing_bars(self, painter, x, y):
-        """Draw dancing bars visualization."""
-        painter.setPen(QColor(100, 100, 100))
-        font = QFont("Courier New", 12)
-        painter.setFont(font)
-        painter.drawText(x, y - 10, "VISUALIZER")
-        
-        # Bar dimensions
-        bar_w = 20
-        bar_spacing = 8
-        max_h = 80
+    def _draw_dancing_bars(self, painter):
+        """Draw dancing bars visualization (label is part of the chrome)."""
+        base_y = self._bar_base_y
+        bar_w = self.BAR_WIDTH
+        scale = self.BAR_SCALE
         
         painter.setPen(Qt.NoPen)
         
-        for i, height in enumerate(self.bar_heights):
-            bar_h = height * (max_h // 8)
-            bx = x + i * (bar_w + bar_spacing)
-            by = y + max_h - bar_h
-            
-            # Color based on playing state
-            if self.is_playing and not self.is_paused:
-                color = QColor(150, 220, 150)  # Green-ish
-            else:
-                color = QColor(80, 80, 80)  # Gray
-            
-            painter.setBrush(QBrush(color))
-            painter.drawRect(bx, by, bar_w, bar_h)
+        # Color based on playing state - same for every bar
+        if self.is_playing and not self.is_paused:
+            painter.setBrush(self._BRUSH_BAR_ACTIVE)
+        else:
+            painter.setBrush(self._BRUSH_BAR_IDLE)
+        
+        # All bars in one batched call
+        painter.drawRects([
+            QRect(x, base_y - height * scale, bar_w, height * scale)
+            for x, height in zip(self._bar_xs, self.bar_heights)
+        ])
     
     def _draw_keyboard(self, painter):
+        """Blit the on-screen keyboard, rendering it once per CAPS state."""
+        pixmap = self._kb_pixmaps.get(self.caps_lock)
+        if pixmap is None:
+            pixmap = self._render_keyboard()
+            self._kb_pixmaps[self.caps_lock] = pixmap
+        painter.drawPixmap(0, self.height() - self.KEYBOARD_HEIGHT, pixmap)
+    
+    def _render_keyboard(self):
+        """Render the keyboard panel for the current CAPS state into a pixmap."""
+        pixmap = QPixmap(self.width(), self.KEYBOARD_HEIGHT)
+        pixmap.fill(Qt.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        # Key rects are kept in widget coordinates for hit-testing
+        painter.translate(0, -(self.height() - self.KEYBOARD_HEIGHT))
+        self._paint_keyboard(painter)
+        painter.end()
+        return pixmap
+    
+    def _paint_keyboard(self, painter):
         """Draw the native on-screen keyboard for search."""
         w, h = self.width(), self.height()
         
         # Keyboard background (semi-transparent overlay)
-        painter.setBrush(QBrush(QColor(0, 0, 0, 230)))
+        painter.setBrush(self._BRUSH_KEYBOARD)
         painter.setPen(Qt.NoPen)
-        keyboard_height = 280
+        keyboard_height = self.KEYBOARD_HEIGHT
         keyboard_y = h - keyboard_height
         painter.drawRect(0, keyboard_y, w, keyboard_height)
         
         # Border at top of keyboard
-        painter.setPen(QPen(QColor(80, 80, 80), 2))
+        painter.setPen(self._PEN_KEYBOARD_EDGE)
         painter.drawLine(0, keyboard_y, w, keyboard_y)
         
-        # Key dimensions
-        key_w = 45
-        key_h = 45
-        spacing = 5
-        
-        start_y = keyboard_y + 15
-        
-        # Store key rects for click detection
-        self._keyboard_keys = {}
-        
-        # Draw letter/number rows
-        for row_idx, row in enumerate(self.KEYBOARD_ROWS):
-            row_width = len(row) * (key_w + spacing) - spacing
-            start_x = (w - row_width) // 2
-            y = start_y + row_idx * (key_h + spacing)
-            
-            for col_idx, letter in enumerate(row):
-                x = start_x + col_idx * (key_w + spacing)
-                display_letter = letter if self.caps_lock or letter.isdigit() else letter.lower()
-                self._draw_key(painter, x, y, key_w, key_h, display_letter, QColor(60, 60, 60))
-                self._keyboard_keys[letter] = QRectF(x, y, key_w, key_h)
+        # Letter/number keys
+        for letter, rect in self._letter_key_rects:
+            display_letter = letter if self.caps_lock or letter.isdigit() else letter.lower()
+            self._draw_key(painter, rect, display_letter, self._COL_KEY)
         
         # Bottom row: CAPS, SPACE, BACKSPACE, SEARCH
-        bottom_y = start_y + 4 * (key_h + spacing)
-        
-        # Calculate positions for bottom row
-        total_bottom_width = 70 + spacing + 200 + spacing + 70 + spacing + 100  # CAPS + SPACE + BACK + SEARCH
-        bottom_start_x = (w - total_bottom_width) // 2
-        
-        # CAPS LOCK button
-        caps_color = QColor(100, 150, 100) if self.caps_lock else QColor(60, 60, 60)
-        self._draw_key(painter, bottom_start_x, bottom_y, 70, key_h, "CAPS", caps_color)
-        self._caps_rect = QRectF(bottom_start_x, bottom_y, 70, key_h)
-        
-        # SPACE button
-        space_x = bottom_start_x + 70 + spacing
-        self._draw_key(painter, space_x, bottom_y, 200, key_h, "SPACE", QColor(60, 60, 60))
-        self._space_rect = QRectF(space_x, bottom_y, 200, key_h)
-        
-        # BACKSPACE button
-        back_x = space_x + 200 + spacing
-        self._draw_key(painter, back_x, bottom_y, 70, key_h, "⌫", QColor(120, 80, 80))
-        self._backspace_rect = QRectF(back_x, bottom_y, 70, key_h)
-        
-        # SEARCH button
-        search_x = back_x + 70 + spacing
-        self._draw_key(painter, search_x, bottom_y, 100, key_h, "SEARCH", QColor(80, 120, 80))
-        self._search_btn_rect = QRectF(search_x, bottom_y, 100, key_h)
+        caps_color = self._COL_KEY_CAPS_ON if self.caps_lock else self._COL_KEY
+        self._draw_key(painter, self._caps_rect, "CAPS", caps_color)
+        self._draw_key(painter, self._space_rect, "SPACE", self._COL_KEY)
+        self._draw_key(painter, self._backspace_rect, "⌫", self._COL_KEY_BACKSPACE)
+        self._draw_key(painter, self._search_btn_rect, "SEARCH", self._COL_KEY_SEARCH)
         
         # Close keyboard button (X) at top right of keyboard
-        close_x = w - 50
-        close_y = keyboard_y + 10
-        self._draw_key(painter, close_x, close_y, 40, 35, "✕", QColor(120, 60, 60))
-        self._close_kb_rect = QRectF(close_x, close_y, 40, 35)
-    
-    def _draw_key(self, painter, x, y, w, h, text, color):
-        """Draw a keyboard key."""
-        painter.setPen(QPen(QColor(100, 100, 100), 1))
-        painter.setBrush(QBrush(color))
-        painter.drawRoundedRect(int(x), int(y), int(w), int(h), 5, 5)
-        
-        painter.setPen(QColor(240, 240, 240))
-        font_size = 10 if len(text) > 2 else 14
-        font = QFont("Courier New", font_size, QFont.Bold)
-        painter.setFont(font)
-        painter.drawText(int(x), int(y), int(w), int(h), Qt.AlignCenter, text)
+        self._draw_key(painter, self._close_kb_rect, "✕", self._COL_KEY_CLOSE)
+    
+    def _draw_key(self, painter, rect, text, color):
+        """Draw a keyboard key in an integer QRect."""
+        painter.setPen(self._PEN_KEY)
+        painter.setBrush(color)
+        painter.drawRoundedRect(rect, 5, 5)
+        
+        painter.setPen(self._COL_KEY_TEXT)
+        painter.setFont(self._font_key_small if len(text) > 2 else self._font_key)
+        painter.drawText(rect, Qt.AlignCenter, text)
+    
+    def resizeEvent(self, event):
+        """Re-layout and drop cached pixmaps - both depend on widget size."""
+        self._recompute_geometry()
+        self._chrome_pixmap = None
+        self._kb_pixmaps.clear()
+        super().resizeEvent(event)
+    
+    def _key_at(self, x, y):
+        """Return the letter/number key under (x, y), or None."""
+        row_starts, start_y, key_w, key_h, spacing = self._kb_grid
+        pitch_x, pitch_y = key_w + spacing, key_h + spacing
+        
+        row, off_y = divmod(y - start_y, pitch_y)
+        if not 0 <= row < len(self.KEYBOARD_ROWS) or off_y >= key_h:
+            return None
+        col, off_x = divmod(x - row_starts[row], pitch_x)
+        if not 0 <= col < len(self.KEYBOARD_ROWS[row]) or off_x >= key_w:
+            return None  # Outside the row or in the gap between keys
+        return self.KEYBOARD_ROWS[row][col]
     
     def _handle_keyboard_click(self, pos):
         """Handle clicks on the native keyboard. Returns True if handled."""
@@ -407,102 +685,102 @@ class MusicView(QWidget):
             return False
         
         x, y = pos.x(), pos.y()
+        handled = True
         
-        # Check close button
-        if hasattr(self, '_close_kb_rect') and self._close_kb_rect.contains(x, y):
-            self.keyboard_visible = False
-            self.update()
-            return True
-        
-        # Check letter/number keys
-        if hasattr(self, '_keyboard_keys'):
-            for letter, rect in self._keyboard_keys.items():
-                if rect.contains(x, y):
-                    current_text = self.search_input.text()
-                    char = letter if self.caps_lock or letter.isdigit() else letter.lower()
-                    self.search_input.setText(current_text + char)
-                    self.update()
-                    return True
-        
-        # Check CAPS key
-        if hasattr(self, '_caps_rect') and self._caps_rect.contains(x, y):
+        if self._close_kb_rect.contains(x, y):
+            # Close button
+            self._hide_keyboard()
+        elif self._caps_rect.contains(x, y):
+            # CAPS key
             self.caps_lock = not self.caps_lock
-            self.update()
-            return True
-        
-        # Check SPACE key
-        if hasattr(self, '_space_rect') and self._space_rect.contains(x, y):
-            current_text = self.search_input.text()
-            self.search_input.setText(current_text + ' ')
-            self.update()
-            return True
-        
-        # Check BACKSPACE key
-        if hasattr(self, '_backspace_rect') and self._backspace_rect.contains(x, y):
-            current_text = self.search_input.text()
-            if current_text:
-                self.search_input.setText(current_text[:-1])
-            self.update()
-            return True
-        
-        # Check SEARCH key
-        if hasattr(self, '_search_btn_rect') and self._search_btn_rect.contains(x, y):
-            self.keyboard_visible = False
+        elif self._space_rect.contains(x, y):
+            # SPACE key
+            self._set_search_text(self._search_text + ' ')
+        elif self._backspace_rect.contains(x, y):
+            # BACKSPACE key
+            if self._search_text:
+                self._set_search_text(self._search_text[:-1])
+        elif self._search_btn_rect.contains(x, y):
+            # SEARCH key
             self._search_and_play()
-            self.update()
-            return True
-        
-        return False
+        else:
+            # Letter/number keys
+            letter = self._key_at(x, y)
+            handled = letter is not None
+            if handled:
+                char = letter if self.caps_lock or letter.isdigit() else letter.lower()
+                self._set_search_text(self._search_text + char)
+        
+        if handled:
+            # Keyboard plus search box (text and border) - Qt merges the two
+            self.update(self._keyboard_rect())
+            self.update(self.SEARCH_BOX_RECT)
+        return handled
     
     def mousePressEvent(self, event):
         """Handle mouse clicks."""
         pos = event.pos()
+        x, y = pos.x(), pos.y()
         
         # Check keyboard first if visible
         if self.keyboard_visible:
             if self._handle_keyboard_click(pos):
                 return
         
+        # Check search box
+        if self.SEARCH_BOX_RECT.contains(x, y):
+            self._on_search_box_clicked()
+            return
+        
         # Check transport buttons
-        if hasattr(self, '_prev_rect') and self._prev_rect.contains(pos.x(), pos.y()):
+        if self._prev_rect.contains(x, y):
             self._previous_track()
             return
-        if hasattr(self, '_play_rect') and self._play_rect.contains(pos.x(), pos.y()):
+        if self._play_rect.contains(x, y):
             self._toggle_play_pause()
             return
-        if hasattr(self, '_next_rect') and self._next_rect.contains(pos.x(), pos.y()):
+        if self._next_rect.contains(x, y):
             self._next_track()
             return
         
         # Check volume controls
-        if hasattr(self, '_vol_down_rect') and self._vol_down_rect.contains(pos.x(), pos.y()):
+        if self._vol_down_rect.contains(x, y):
             self._volume_down()
             return
-        if hasattr(self, '_vol_up_rect') and self._vol_up_rect.contains(pos.x(), pos.y()):
+        if self._vol_up_rect.contains(x, y):
             self._volume_up()
             return
-        if hasattr(self, '_vol_bar_rect') and self._vol_bar_rect.contains(pos.x(), pos.y()):
+        if self._vol_bar_rect.contains(x, y):
             # Click on bar to set volume
-            rel_x = pos.x() - self._vol_bar_rect.x()
-            self.volume_level = int((rel_x / self._vol_bar_rect.width()) * self.VOLUME_STEPS)
-            self.volume_level = max(0, min(self.VOLUME_STEPS, self.volume_level))
-            self._apply_volume()
+            rel_x = x - self._vol_bar_rect.x()
+            level = int((rel_x / self._vol_bar_rect.width()) * self.VOLUME_STEPS)
+            level = max(0, min(self.VOLUME_STEPS, level))
+            if level != self.volume_level:  # Re-tapping the same block is a no-op
+                self.volume_level = level
+                self._apply_volume()
             return
         
         # Check back button
-        if hasattr(self, '_back_rect') and self._back_rect.contains(pos.x(), pos.y()):
+        if self._back_rect.contains(x, y):
             self._go_back()
             return
     
     def _search_and_play(self):
         """Search and play music."""
-        query = self.search_input.text().strip()
+        query = self.search_query
         if not query:
             return
         
+        # Keyboard closes automatically once a search is submitted
+        self._hide_keyboard()
+        normalized = query.casefold()
+        if normalized == self.inflight_query:
+            return  # Same search already running - ignore the double submit
+        
         logger.info(f"Searching for: {query}")
-        self.keyboard_visible = False
+        self.inflight_query = normalized
         self.music_service.search_and_play(query)
+        self.update(self.TRACK_RECT)  # Status line
     
     def _toggle_play_pause(self):
         """Toggle play/pause."""
@@ -511,7 +789,8 @@ class MusicView(QWidget):
                 self.music_service.resume()
             else:
                 self.music_service.pause()
-        self.update()
+        # No update() here: the service reports the new state through
+        # music_state_changed, which repaints once
     
     def _previous_track(self):
         """Previous track."""
@@ -534,11 +813,16 @@ class MusicView(QWidget):
             self._apply_volume()
     
     def _apply_volume(self):
-        """Apply current volume level."""
+        """Show the new volume level now; push it to the service once taps settle."""
+        self.update(self.VOLUME_RECT)
+        self.volume_commit_timer.start()
+    
+    def _commit_volume(self):
+        """Push current volume level to the music service and settings."""
+        self.volume_commit_timer.stop()
         volume = self.volume_level * 10  # Convert to 0-100
         self.music_service.set_volume(volume)
         self.app_state.set_setting('volume', volume)
-        self.update()
     
     def _go_back(self):
         """Go back to menu."""
@@ -546,12 +830,21 @@ class MusicView(QWidget):
         if self.navigate:
             self.navigate(AppState.VIEW_MENU)
     
+    def focusOutEvent(self, event):
+        """Close the on-screen keyboard when focus moves elsewhere."""
+        if event.reason() != Qt.PopupFocusReason:
+            self._hide_keyboard()
+        super().focusOutEvent(event)
+    
     def keyPressEvent(self, event: QKeyEvent):
         """Handle keyboard input."""
         key = event.key()
         
         if key == Qt.Key_Escape:
             self._go_back()
+        elif key in (Qt.Key_Return, Qt.Key_Enter):
+            if not event.isAutoRepeat():  # A held Enter submits once
+                self._search_and_play()
         elif key == Qt.Key_Space:
             self._toggle_play_pause()
         elif key == Qt.Key_Left:
@@ -567,37 +860,97 @@ class MusicView(QWidget):
     
     def _on_music_state_changed(self, state):
         """Handle music state change from service."""
-        self.is_playing = state.get('playing', False)
-        self.is_paused = state.get('paused', False)
-        
-        # Start/stop bars animation
+        playing = state.get('playing', False)
+        paused = state.get('paused', False)
+        if playing == self.is_playing and paused == self.is_paused:
+            return  # No visible change
+        
+        self.is_playing = playing
+        self.is_paused = paused
+        self._sync_bars_timer()
+        # Play/pause icon, status line and bar color
+        self.update(self.TRANSPORT_RECT)
+        self.update(self.TRACK_RECT)
+        self.update(self.BARS_RECT)
+    
+    def _sync_bars_timer(self):
+        """Start/stop bars animation to match play state."""
         if self.is_playing and not self.is_paused:
             self.bars_timer.start(150)
         else:
             self.bars_timer.stop()
-            self.bar_heights = [2] * 8
-        
-        self.update()
+            self.bar_heights = [2] * self.BAR_COUNT
     
     def _on_track_changed(self, track):
         """Handle track change from service."""
-        if track:
-            self.current_track = track
+        track = track or {'title': 'No track', 'artist': ''}
+        if track == self.current_track:
+            return  # Same track - nothing to repaint
+        
+        self.current_track = track
+        self._elide_track_info()
+        self.update(self.TRACK_RECT)
+    
+    def _elide_track_info(self):
+        """Elide title/artist to the track area once per track, not per paint."""
+        width = self.TRACK_RECT.width()
+        self._elided_title = self._title_fm.elidedText(
+            self.current_track.get('title', 'No track'), Qt.ElideRight, width)
+        self._elided_artist = self._artist_fm.elidedText(
+            self.current_track.get('artist', ''), Qt.ElideRight, width)
+    
+    def _on_search_completed(self, result):
+        """Handle search completion from service (success or failure)."""
+        # Ignore completion of an older search superseded by a newer one
+        if result['query'].strip().casefold() != self.inflight_query:
+            return
+        self.inflight_query = None
+        self.update(self.TRACK_RECT)  # Status line
+    
+    def showEvent(self, event):
+        """Resume the bars animation once visible again."""
+        super().showEvent(event)
+        self._sync_bars_timer()
+    
+    def hideEvent(self, event):
+        """Stop animating while hidden - nothing would be seen."""
+        super().hideEvent(event)
+        self.bars_timer.stop()
+    
+    def _on_application_state_changed(self, state):
+        """Stop animating while the application is inactive or suspended."""
+        if state == Qt.ApplicationActive:
+            if self.isVisible():
+                self._sync_bars_timer()
         else:
-            self.current_track = {'title': 'No track', 'artist': ''}
-        self.update()
+            self.bars_timer.stop()
+    
+    def closeEvent(self, event):
+        """Drop app_state callbacks so a discarded view isn't kept alive."""
+        for name, callback in self._app_callbacks:
+            self.app_state.unregister_callback(name, callback)
+        self._app_callbacks = []
+        self.bars_timer.stop()
+        super().closeEvent(event)
     
     def on_activate(self):
         """Called when view becomes active."""
         logger.debug("Music view activated")
-        self.repaint_timer.start(100)
-        
-        # Update from current state
-        self._on_music_state_changed({
-            'playing': self.app_state.is_music_playing(),
-            'paused': self.app_state.is_music_paused()
-        })
-        self._on_track_changed(self.app_state.get_current_track())
+        
+        # Update from current state - one repaint when updates are re-enabled
+        self.setUpdatesEnabled(False)
+        try:
+            # Pick up volume changed elsewhere (settings, voice). Assign
+            # directly - going through _apply_volume would echo it back.
+            self.volume_level = self.app_state.get_setting('volume', 70) // 10
+            self._on_music_state_changed({
+                'playing': self.app_state.is_music_playing(),
+                'paused': self.app_state.is_music_paused()
+            })
+            self._on_track_changed(self.app_state.get_current_track())
+            self._sync_bars_timer()  # Stopped by on_deactivate even if state is unchanged
+        finally:
+            self.setUpdatesEnabled(True)
         self.setFocus()
     
     def on_deactivate(self):
@@ -605,3 +958,7 @@ class MusicView(QWidget):
         logger.debug("Music view deactivated")
         self.keyboard_visible = False
         self.bars_timer.stop()
+        
+        # Don't drop a volume change still waiting on the debounce
+        if self.volume_commit_timer.isActive():
+            self._commit_volume()
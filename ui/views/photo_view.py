@@ -4,17 +4,207 @@ Fullscreen photo slideshow with minimal controls.
 Image swaps only, no fade transitions.
 """
 
+import hashlib
+import importlib.util
 import logging
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from PyQt5.QtCore import Qt, QTimer, QRectF
+from PyQt5.QtCore import Qt, QTimer, QRect, QRectF, QSize, QPointF, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt5.QtWidgets import QWidget
-from PyQt5.QtGui import QPixmap, QFont, QPainter, QColor, QPen, QBrush
+from PyQt5.QtGui import (
+    QPixmap, QPixmapCache, QFont, QPainter, QColor, QPen, QBrush, QImage, QImageReader,
+    QImageIOHandler, QStaticText, QTransform
+)
+
+# Optional: Pillow's Lanczos downscale for first-time (uncached) photos.
+# Only probed here - the import itself waits until a photo needs it.
+PIL_AVAILABLE = importlib.util.find_spec('PIL') is not None
 
 from models.app_state import AppState
 from services.photo_service import PhotoService
 
 logger = logging.getLogger(__name__)
 
+class _ThumbnailCache:
+    """
+    Screen-sized copies of photos on disk, so restarts skip full-res decodes.
+    
+    Files are keyed by photo path, mtime and target size; the oldest (by
+    mtime, touched on every hit) are evicted past max_bytes. Thread-safe.
+    """
+    
+    def __init__(self, directory: Path, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+    
+    def _path_for(self, photo_path: Path, box: QSize) -> Path:
+        mtime = os.stat(photo_path).st_mtime_ns
+        key = f"{photo_path}:{mtime}:{box.width()}x{box.height()}"
+        return self.directory / f"{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}.png"
+    
+    def load(self, photo_path: Path, box: QSize):
+        """Cached image for photo_path at box, or None."""
+        try:
+            cache_path = self._path_for(photo_path, box)
+            if not cache_path.exists():
+                return None
+            image = QImage(str(cache_path))
+            if image.isNull():
+                return None
+            os.utime(cache_path)  # Mark as recently used
+            return image
+        except OSError:
+            return None
+    
+    def store(self, photo_path: Path, box: QSize, image: QImage):
+        """Save a scaled image and evict old entries past the size limit."""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            cache_path = self._path_for(photo_path, box)
+            # Write then rename, so a concurrent load never sees half a file
+            tmp_path = cache_path.with_suffix('.tmp')
+            if image.save(str(tmp_path), "PNG"):
+                os.replace(tmp_path, cache_path)
+            self._evict()
+        except OSError as e:
+            logger.debug(f"Thumbnail cache write failed: {e}")
+    
+    def _evict(self):
+        """Delete least recently used files until under max_bytes."""
+        with self._lock:
+            entries = []
+            total = 0
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith('.png'):
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+                    total += st.st_size
+            if total <= self.max_bytes:
+                return
+            entries.sort()
+            for _, size, path in entries:
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                if total <= self.max_bytes:
+                    break
+
+
+def _read_photo_pil(photo_path: Path, box: QSize):
+    """
+    Downscale a photo larger than box with Pillow.
+    
+    Returns:
+        QImage, or None if Pillow can't read it or no downscale is needed
+    """
+    from PIL import Image, ImageOps
+    
+    try:
+        with Image.open(photo_path) as im:
+            size = (box.width(), box.height())
+            if im.getexif().get(0x0112, 1) in (5, 6, 7, 8):
+                size = size[::-1]  # Rotated 90 degrees - fit before transposing
+            if im.width <= size[0] and im.height <= size[1]:
+                return None
+            # JPEG: let libjpeg reduce in the DCT domain first
+            im.draft('RGB', size)
+            im = ImageOps.exif_transpose(im)
+            im.thumbnail((box.width(), box.height()), getattr(Image, 'Resampling', Image).LANCZOS)
+            
+            if 'A' in im.getbands():
+                im, fmt, depth = im.convert('RGBA'), QImage.Format_RGBA8888, 4
+            else:
+                im, fmt, depth = im.convert('RGB'), QImage.Format_RGB888, 3
+            data = im.tobytes()
+            # copy() - the QImage must not outlive the bytes buffer
+            return QImage(data, im.width, im.height, im.width * depth, fmt).copy()
+    except Exception as e:
+        logger.debug(f"Pillow could not downscale {photo_path}: {e}")
+        return None
+
+
+def _read_photo(photo_path: Path, box: QSize, thumbnails: _ThumbnailCache = None,
+                fast: bool = False):
+    """
+    Decode a photo, letting the decoder downscale it to fit box.
+    
+    Safe to call off the GUI thread (works on QImage, not QPixmap).
+    Large photos are served from / saved to thumbnails when given. With
+    fast, the decoder may use nearest-neighbour scaling (a draft).
+    
+    Returns:
+        (QImage, downscaled, draft) - image is null on failure
+    """
+    if thumbnails is not None:
+        image = thumbnails.load(photo_path, box)
+        if image is not None:
+            return image, True, False
+    
+    if PIL_AVAILABLE and not fast:
+        image = _read_photo_pil(photo_path, box)
+        if image is not None:
+            if thumbnails is not None:
+                thumbnails.store(photo_path, box, image)
+            return image, True, False
+    
+    reader = QImageReader(str(photo_path))
+    reader.setAutoTransform(True)  # Honour EXIF orientation
+    
+    # Let the decoder downscale large photos (libjpeg scales in the DCT
+    # domain) instead of decoding every pixel and throwing most away
+    downscaled = False
+    size = reader.size()
+    if size.isValid():
+        # Own copy - box stays the caller's (untransposed) thumbnail key
+        fit = QSize(box)
+        if reader.transformation() & QImageIOHandler.TransformationRotate90:
+            fit.transpose()  # Scaled size applies before rotation
+        if size.width() > fit.width() or size.height() > fit.height():
+            reader.setScaledSize(size.scaled(fit, Qt.KeepAspectRatio))
+            downscaled = True
+    
+    # Below quality 50 the JPEG plugin finishes the scale with fast
+    # (nearest) sampling instead of a smooth filter
+    draft = fast and downscaled
+    if draft:
+        reader.setQuality(25)
+    
+    image = reader.read()
+    if image.isNull():
+        logger.warning(f"Failed to load image: {photo_path} ({reader.errorString()})")
+    elif downscaled and not draft and thumbnails is not None:
+        # Only worth caching when the source is bigger than the screen
+        thumbnails.store(photo_path, box, image)
+    return image, downscaled, draft
+
+
+class _DecodeSignals(QObject):
+    """Carries decode results from pool threads back to the GUI thread."""
+    decoded = pyqtSignal(object, object, QImage, bool, bool)  # path, box, image, downscaled, draft
+
+
+class _DecodeJob(QRunnable):
+    """Decode one photo on a QThreadPool thread."""
+    
+    def __init__(self, photo_path: Path, box: QSize, signals: _DecodeSignals,
+                 thumbnails: _ThumbnailCache = None, fast: bool = False):
+        super().__init__()
+        self.photo_path = photo_path
+        self.box = QSize(box)
+        self.signals = signals
+        self.thumbnails = thumbnails
+        self.fast = fast
+    
+    def run(self):
+        image, downscaled, draft = _read_photo(self.photo_path, self.box, self.thumbnails, self.fast)
+        self.signals.decoded.emit(self.photo_path, self.box, image, downscaled, draft)
+
+
 # Add VIEW_MENU to AppState if not present
 if not hasattr(AppState, 'VIEW_MENU'):
     AppState.VIEW_MENU = 'menu'
@@ -28,27 +218,98 @@ class PhotoView(QWidget):
     Minimal control bar at bottom.
     """
     
+    PRELOAD_CACHE_SIZE = 2  # Decoded neighbour photos kept ready
+    PREFETCH_OFFSETS = (1, -1)  # Neighbours to decode ahead, in priority order
+    MAX_PREFETCH_JOBS = 2  # Background decodes in flight (SD cards thrash)
+    CONTROL_BAR_HEIGHT = 60
+    PIXMAP_CACHE_KB = 64 * 1024  # Scaled photos kept for revisits
+    RESIZE_SLOP = 4  # px - smaller size changes skip the live rescale
+    THUMBNAIL_DIR = Path.home() / '.cache' / 'smart_frame'
+    
+    # Paint resources, built once (fonts are made in _init_fonts - they
+    # need a QApplication)
+    _COL_PLACEHOLDER = QColor(80, 80, 80)
+    _COL_COUNTER = QColor(160, 160, 160)
+    _BRUSH_BAR = QBrush(QColor(0, 0, 0, 180))
+    _PEN_BUTTON = QPen(QColor(100, 100, 100), 2)
+    _BRUSH_BUTTON = QBrush(QColor(30, 30, 30))
+    _COL_BUTTON_TEXT = QColor(200, 200, 200)
+    
     def __init__(self, app_state: AppState, photo_service: PhotoService, navigate_callback):
         super().__init__()
         self.app_state = app_state
         self.photo_service = photo_service
         self.navigate = navigate_callback
         
-        self.current_pixmap = None
+        # Decode and scale work on QImage; the QPixmap is made at first paint
+        self.current_pixmap = None  # Scaled to fit, as drawn
+        self._current_image = None  # Scaled to fit, not yet converted to current_pixmap
+        self._current_cache_key = None  # QPixmapCache key for _current_image, if final
+        self._raw_image = None  # Decoded photo (downscaled at decode time if large)
+        self._raw_downscaled = False  # True if _raw_image is smaller than the file
+        self._raw_draft = False  # True if _raw_image was fast-scaled (prefetch)
+        self._current_path = None  # Path _raw_image was decoded from
+        self._resizing = False  # Live resize in progress - cheap scaling only
+        self._pending_path = None  # Photo to show once its background decode lands
+        
+        # Photos are decoded in the background (the next one ahead of time)
+        self._pool = QThreadPool.globalInstance()
+        self._decode_signals = _DecodeSignals()
+        self._decode_signals.decoded.connect(self._on_decoded)
+        self._preloaded = OrderedDict()  # path -> (box, QImage, downscaled, draft)
+        self._preloading = set()  # paths with a decode job in flight
+        self._thumbnails = _ThumbnailCache(
+            self.THUMBNAIL_DIR,
+            app_state.get_setting('photo_cache_max_mb', 200) * 1024 * 1024
+        )
         self.is_playing = True
         self.show_controls = True
         self.control_hide_timer = None
+        self._active = False  # Between on_activate and on_deactivate
+        self._controls_cache = {}  # is_playing -> pre-rendered control bar
+        # Older photo services lack the counter API - check once, not per paint
+        self._has_counter = (hasattr(photo_service, 'get_photo_count')
+                             and hasattr(photo_service, 'get_current_index'))
         
+        self._init_fonts()
         self._init_ui()
         self._init_timers()
+        self._recompute_layout()
         
         # Listen for photo updates
         app_state.register_callback('photo_changed', self._on_photo_changed)
     
+    def _init_fonts(self):
+        """Build fonts once instead of on every paint."""
+        self._font_placeholder = QFont("Courier New", 24)
+        self._font_counter = QFont("Courier New", 14)
+        self._font_btn_big = QFont("Courier New", 16)
+        self._font_btn_small = QFont("Courier New", 12)
+        
+        # Placeholder and counter text laid out once - drawStaticText skips
+        # per-paint shaping; the counter is re-laid out only when it changes
+        self._no_photos_static = self._static_text("[ NO PHOTOS ]", self._font_placeholder)
+        self._counter_static = self._static_text("", self._font_counter)
+        self._counter_text = ""
+    
+    @staticmethod
+    def _static_text(text, font):
+        """Plain-text QStaticText prepared for font."""
+        static = QStaticText(text)
+        static.setTextFormat(Qt.PlainText)
+        static.prepare(QTransform(), font)
+        return static
+    
     def _init_ui(self):
         """Initialize UI - pure black background."""
-        self.setStyleSheet("background-color: #000000;")
+        # paintEvent fills its own black background, so Qt skips erasing
+        # (and polishing a stylesheet) under the full-screen photo first
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAutoFillBackground(False)
         self.setFocusPolicy(Qt.StrongFocus)
+        
+        # Going back to a photo (prev/next cycling) reuses its scaled pixmap
+        QPixmapCache.setCacheLimit(self.PIXMAP_CACHE_KB)
     
     def _init_timers(self):
         """Initialize timers."""
@@ -60,42 +321,73 @@ class PhotoView(QWidget):
         self.control_timer = QTimer()
         self.control_timer.timeout.connect(self._hide_controls)
         self.control_timer.setSingleShot(True)
+        
+        # Neighbour prefetch - deferred so it never delays the current paint
+        self.prefetch_timer = QTimer(self)
+        self.prefetch_timer.setSingleShot(True)
+        self.prefetch_timer.setInterval(50)
+        self.prefetch_timer.timeout.connect(self._prefetch_neighbors)
+        
+        # Resize debounce - full-quality rescale once the size settles
+        self.resize_timer = QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.setInterval(200)
+        self.resize_timer.timeout.connect(self._finish_resize)
     
     def paintEvent(self, event):
-        """Paint the photo and controls."""
-        super().paintEvent(event)
+        """
+        Paint the photo and controls.
+        
+        Only ever scheduled via update() - do not use repaint(), it bypasses
+        Qt's coalescing of paint requests.
+        """
+        # A stray update() while hidden/obscured or mid-transition has nothing to draw
+        if not self._active or not self.isVisible() or self.visibleRegion().isEmpty():
+            return
         
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        # Opaque widget - clear the damaged area ourselves
+        painter.fillRect(event.rect(), Qt.black)
+        # Only a pixmap blit and text here - nothing needs edge smoothing
+        painter.setRenderHint(QPainter.TextAntialiasing)
         
         w, h = self.width(), self.height()
         
         # Draw photo
+        if self._current_image is not None:
+            self._convert_current_image()
         if self.current_pixmap and not self.current_pixmap.isNull():
-            # Center the photo
+            # Center the photo, blitting only the part under the dirty rect -
+            # a control bar update touches a thin strip, not the whole photo
             px = (w - self.current_pixmap.width()) // 2
             py = (h - self.current_pixmap.height()) // 2
-            painter.drawPixmap(px, py, self.current_pixmap)
+            target = QRect(px, py, self.current_pixmap.width(), self.current_pixmap.height())
+            target &= event.rect()
+            if not target.isEmpty():
+                painter.drawPixmap(target, self.current_pixmap, target.translated(-px, -py))
         else:
             # No photo placeholder
-            painter.setPen(QColor(80, 80, 80))
-            font = QFont("Courier New", 24)
-            painter.setFont(font)
-            painter.drawText(0, 0, w, h, Qt.AlignCenter, "[ NO PHOTOS ]")
+            size = self._no_photos_static.size()
+            painter.setPen(self._COL_PLACEHOLDER)
+            painter.setFont(self._font_placeholder)
+            painter.drawStaticText(
+                QPointF((w - size.width()) / 2, (h - size.height()) / 2), self._no_photos_static
+            )
         
         # Draw controls if visible
         if self.show_controls:
             self._draw_controls(painter)
     
-    def _draw_controls(self, painter):
-        """Draw the control bar at bottom."""
-        w, h = self.width(), self.height()
+    def _recompute_layout(self):
+        """
+        Compute the control bar geometry for the current size.
         
-        # Semi-transparent bar at bottom
-        bar_h = 60
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(QBrush(QColor(0, 0, 0, 180)))
-        painter.drawRect(0, h - bar_h, w, bar_h)
+        Called from __init__ and resizeEvent only - the display size is
+        fixed, so painting and hit-testing just read these.
+        """
+        w, h = self.width(), self.height()
+        bar_h = self.CONTROL_BAR_HEIGHT
+        self._bar_rect = QRect(0, h - bar_h, w, bar_h)
         
         # Control buttons
         btn_w = 80
@@ -104,52 +396,89 @@ class PhotoView(QWidget):
         center_x = w // 2
         spacing = 20
         
-        # Previous button
         self._prev_rect = QRectF(center_x - btn_w * 1.5 - spacing, btn_y, btn_w, btn_h)
-        self._draw_control_btn(painter, self._prev_rect, "⏮")
-        
-        # Play/Pause button
         self._play_rect = QRectF(center_x - btn_w // 2, btn_y, btn_w, btn_h)
-        play_text = "⏸" if self.is_playing else "▶"
-        self._draw_control_btn(painter, self._play_rect, play_text)
-        
-        # Next button
         self._next_rect = QRectF(center_x + btn_w // 2 + spacing, btn_y, btn_w, btn_h)
-        self._draw_control_btn(painter, self._next_rect, "⏭")
+        self._back_rect = QRectF(20, btn_y, 100, btn_h)  # Left side
+        self._counter_rect = QRect(w - 100, btn_y, 80, btn_h)  # Right side
+    
+    def _draw_controls(self, painter):
+        """Draw the control bar at bottom."""
+        # Bar and buttons only change with play/pause - blit a cached copy
+        bar = self._controls_cache.get(self.is_playing)
+        if bar is None:
+            bar = self._render_controls()
+            self._controls_cache[self.is_playing] = bar
+        painter.drawPixmap(self._bar_rect.topLeft(), bar)
         
-        # Back button (left side)
-        self._back_rect = QRectF(20, btn_y, 100, btn_h)
-        self._draw_control_btn(painter, self._back_rect, "← BACK")
+        # Photo counter - changes every slide, drawn live
+        count = self.photo_service.get_photo_count() if self._has_counter else 0
+        if count > 0:
+            text = f"{self.photo_service.get_current_index() + 1}/{count}"
+            if text != self._counter_text:
+                self._counter_text = text
+                self._counter_static.setText(text)
+                self._counter_static.prepare(QTransform(), self._font_counter)
+            
+            # Right-aligned, vertically centred in the counter rect
+            rect = self._counter_rect
+            size = self._counter_static.size()
+            painter.setPen(self._COL_COUNTER)
+            painter.setFont(self._font_counter)
+            painter.drawStaticText(
+                QPointF(rect.x() + rect.width() - size.width(),
+                        rect.y() + (rect.height() - size.height()) / 2),
+                self._counter_static
+            )
+    
+    def _render_controls(self):
+        """Render the control bar and its buttons for the current play state."""
+        bar = self._bar_rect
+        pixmap = QPixmap(bar.size())
+        pixmap.fill(Qt.transparent)
         
-        # Photo counter (right side)
-        count = self.photo_service.get_photo_count() if hasattr(self.photo_service, 'get_photo_count') else 0
-        index = self.photo_service.get_current_index() if hasattr(self.photo_service, 'get_current_index') else 0
+        painter = QPainter(pixmap)
+        # Axis-aligned rects on whole pixels - only the glyphs need smoothing
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        # Button rects are kept in widget coordinates for hit-testing
+        painter.translate(-bar.topLeft())
         
-        if count > 0:
-            counter_text = f"{index + 1}/{count}"
-            painter.setPen(QColor(160, 160, 160))
-            font = QFont("Courier New", 14)
-            painter.setFont(font)
-            painter.drawText(w - 100, btn_y, 80, btn_h, Qt.AlignRight | Qt.AlignVCenter, counter_text)
+        # Semi-transparent bar
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self._BRUSH_BAR)
+        painter.drawRect(bar)
+        
+        self._draw_control_btn(painter, self._prev_rect, "⏮")
+        self._draw_control_btn(painter, self._play_rect, "⏸" if self.is_playing else "▶")
+        self._draw_control_btn(painter, self._next_rect, "⏭")
+        self._draw_control_btn(painter, self._back_rect, "← BACK")
+        painter.end()
+        return pixmap
     
     def _draw_control_btn(self, painter, rect, text):
         """Draw a control button."""
-        painter.setPen(QPen(QColor(100, 100, 100), 2))
-        painter.setBrush(QBrush(QColor(30, 30, 30)))
+        painter.setPen(self._PEN_BUTTON)
+        painter.setBrush(self._BRUSH_BUTTON)
         painter.drawRect(rect)
         
-        painter.setPen(QColor(200, 200, 200))
-        font = QFont("Courier New", 16 if len(text) <= 2 else 12)
-        painter.setFont(font)
+        painter.setPen(self._COL_BUTTON_TEXT)
+        painter.setFont(self._font_btn_big if len(text) <= 2 else self._font_btn_small)
         painter.drawText(rect, Qt.AlignCenter, text)
     
     def _load_photo(self):
         """Load and display current photo (instant swap, no fade)."""
+        if not self._active:
+            return  # on_activate loads whatever is current by then
+        
         photo_path = self.photo_service.get_current_photo_path()
+        if photo_path != self._pending_path:
+            self._pending_path = None  # Superseded - a late decode just gets preloaded
         
         if not photo_path or not Path(photo_path).exists():
             logger.debug(f"No photo available: {photo_path}")
-            self.current_pixmap = None
+            self._set_current(None)
+            self._raw_image = None
+            self._current_path = None
             self.update()
             return
         
@@ -159,40 +488,178 @@ class PhotoView(QWidget):
             QTimer.singleShot(100, self._load_photo)
             return
         
-        try:
-            pixmap = QPixmap(str(photo_path))
-            if pixmap.isNull():
-                logger.warning(f"Failed to load image: {photo_path}")
-                self.current_pixmap = None
-                self.update()
-                return
-            
-            # Scale to fit screen while maintaining aspect ratio
-            scaled_pixmap = pixmap.scaled(
-                self.width(),
-                self.height() - 60,  # Leave room for controls
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
-            
-            self.current_pixmap = scaled_pixmap
-            logger.debug(f"Loaded photo: {photo_path.name} scaled to {scaled_pixmap.width()}x{scaled_pixmap.height()}")
+        if photo_path == self._current_path and (
+                self.current_pixmap is not None or self._current_image is not None):
+            return  # Already showing it (resizes rescale on their own)
+        
+        # Already scaled for this size earlier - no decode, no scale
+        cached = self._cached_pixmap(photo_path)
+        if cached is not None:
+            # Shallow copy - raster pixmaps share their image data
+            self._raw_image = cached.toImage()
+            self._raw_downscaled = True  # Growing the view must decode again
+            self._raw_draft = False
+            self._current_path = photo_path
+            self._set_current(None)
+            self.current_pixmap = cached
             self.update()
+            self.prefetch_timer.start()
+            return
+        
+        try:
+            # Decode only when the photo actually changed
+            if photo_path != self._current_path:
+                box = self._photo_target_size()
+                preloaded = self._preloaded.pop(photo_path, None)
+                if preloaded is None or preloaded[0] != box:
+                    # Decode off the GUI thread - the previous photo stays
+                    # up until _on_decoded swaps this one in
+                    self._pending_path = photo_path
+                    self._start_decode(photo_path)
+                    return
+                _, image, downscaled, draft = preloaded
+                self._set_raw(photo_path, image, downscaled, draft)
+                if draft:
+                    # Prefetched with fast scaling - swap in a smooth decode
+                    # once it lands (via the pending-photo path)
+                    self._pending_path = photo_path
+                    self._start_decode(photo_path)
+            self._rescale_and_show()
+            self.prefetch_timer.start()
             
         except Exception as e:
             logger.error(f"Error loading photo: {e}")
-            self.current_pixmap = None
+            self._set_current(None)
             self.update()
     
+    def _photo_target_size(self) -> QSize:
+        """Area available to the photo."""
+        return QSize(self.width(), self.height() - 60)  # Leave room for controls
+    
+    def _pixmap_cache_key(self, photo_path) -> str:
+        """QPixmapCache key for a photo scaled to the current target size."""
+        target = self._photo_target_size()
+        return f"{photo_path}:{target.width()}x{target.height()}"
+    
+    def _cached_pixmap(self, photo_path):
+        """Photo already scaled for the current size, or None."""
+        # Older PyQt5 returns a null pixmap on a miss rather than None
+        pixmap = QPixmapCache.find(self._pixmap_cache_key(photo_path))
+        return pixmap if pixmap is not None and not pixmap.isNull() else None
+    
+    def _set_raw(self, photo_path: Path, image: QImage, downscaled: bool, draft: bool = False) -> bool:
+        """Make a decoded image the current photo. Returns False if it is null."""
+        if image.isNull():
+            self._raw_image = None
+            self._current_path = None
+            return False
+        
+        self._raw_image = image
+        self._raw_downscaled = downscaled
+        self._raw_draft = draft
+        self._current_path = photo_path
+        return True
+    
+    def _start_decode(self, photo_path: Path, fast: bool = False):
+        """Queue a background decode unless one is already in flight."""
+        if photo_path in self._preloading:
+            return
+        self._preloading.add(photo_path)
+        self._pool.start(_DecodeJob(
+            photo_path, self._photo_target_size(), self._decode_signals, self._thumbnails, fast
+        ))
+    
+    def _prefetch_neighbors(self):
+        """Decode the photos either side of the current one in the background."""
+        for offset in self.PREFETCH_OFFSETS:
+            if len(self._preloading) >= self.MAX_PREFETCH_JOBS:
+                break
+            path = self.photo_service.peek_photo_path(offset)
+            if (path is None or path == self._current_path or path in self._preloaded
+                    or self._cached_pixmap(path) is not None):
+                continue
+            # May never be shown - skip the smooth filter until it is
+            self._start_decode(path, fast=True)
+    
+    def _on_decoded(self, photo_path, box, image, downscaled, draft):
+        """Show or store a background-decoded photo (GUI thread)."""
+        self._preloading.discard(photo_path)
+        
+        if photo_path == self._pending_path and self._active:
+            # The photo the user is waiting on
+            self._pending_path = None
+            if not self._set_raw(photo_path, image, downscaled, draft):
+                self._set_current(None)
+                self.update()
+                return
+            if draft:
+                # Was already in flight as a prefetch - smooth one follows
+                self._pending_path = photo_path
+                self._start_decode(photo_path)
+            self._rescale_and_show()
+            self.prefetch_timer.start()
+            return
+        
+        if image.isNull():
+            return
+        self._preloaded[photo_path] = (box, image, downscaled, draft)
+        while len(self._preloaded) > self.PRELOAD_CACHE_SIZE:
+            self._preloaded.popitem(last=False)
+    
+    def _rescale_and_show(self):
+        """Scale the decoded photo to the current size and display it."""
+        if self._raw_image is None:
+            return
+        
+        target = self._photo_target_size()
+        fit = self._raw_image.size().scaled(target, Qt.KeepAspectRatio)
+        interim = False
+        if self._raw_downscaled and fit.width() > self._raw_image.width() and not self._resizing:
+            # Decoded for a smaller area - decode again at the new size in
+            # the background (lands via the pending-photo path), showing a
+            # quick upscale meanwhile
+            self._pending_path = self._current_path
+            self._start_decode(self._current_path)
+            interim = True
+        
+        if fit == self._raw_image.size():
+            # Decoder already hit the exact size
+            scaled = self._raw_image
+        else:
+            # Scale to fit screen while maintaining aspect ratio; smooth
+            # filtering is only worth it for the settled frame
+            mode = Qt.FastTransformation if self._resizing or interim else Qt.SmoothTransformation
+            scaled = self._raw_image.scaled(target, Qt.KeepAspectRatio, mode)
+        
+        final = not (self._resizing or interim or self._raw_draft)
+        self._set_current(scaled, self._pixmap_cache_key(self._current_path) if final else None)
+        logger.debug(f"Showing photo: {self._current_path.name} scaled to {scaled.width()}x{scaled.height()}")
+        self.update()
+    
+    def _set_current(self, image, cache_key=None):
+        """Replace the displayed photo; the QPixmap is made at the next paint."""
+        self._current_image = image
+        self._current_cache_key = cache_key
+        self.current_pixmap = None
+    
+    def _convert_current_image(self):
+        """Upload the scaled photo to a QPixmap (GUI thread, once per photo)."""
+        self.current_pixmap = QPixmap.fromImage(self._current_image)
+        if self._current_cache_key is not None:
+            QPixmapCache.insert(self._current_cache_key, self.current_pixmap)
+        self._current_image = None
+        self._current_cache_key = None
+    
     def _next_photo(self):
         """Go to next photo."""
+        if not self._active:
+            return  # Late slideshow tick after on_deactivate
+        # The service's photo_changed callback loads it - no second load here
         self.photo_service.next_photo()
-        self._load_photo()  # Explicitly load to ensure update
     
     def _previous_photo(self):
         """Go to previous photo."""
         self.photo_service.previous_photo()
-        self._load_photo()  # Explicitly load to ensure update
     
     def _toggle_slideshow(self):
         """Toggle slideshow play/pause."""
@@ -203,19 +670,26 @@ class PhotoView(QWidget):
             interval = self.app_state.get_setting('slideshow_interval', 5) * 1000
             self.slideshow_timer.start(interval)
             self.is_playing = True
-        self.update()
+        self.update(self._controls_rect())  # Only the play/pause button changed
+    
+    def _controls_rect(self) -> QRect:
+        """Area covered by the control bar."""
+        return self._bar_rect
     
     def _show_controls_temp(self):
         """Show controls temporarily."""
-        self.show_controls = True
-        self.update()
+        # Toggling the bar repaints only its strip - the photo pixels
+        # elsewhere are left alone instead of being blitted again
+        if not self.show_controls:
+            self.show_controls = True
+            self.update(self._controls_rect())
         # Auto-hide after 3 seconds
         self.control_timer.start(3000)
     
     def _hide_controls(self):
         """Hide controls."""
         self.show_controls = False
-        self.update()
+        self.update(self._controls_rect())
     
     def mousePressEvent(self, event):
         """Handle mouse clicks."""
@@ -226,18 +700,15 @@ class PhotoView(QWidget):
         
         # Check control buttons if visible
         if self.show_controls:
-            if hasattr(self, '_prev_rect') and self._prev_rect.contains(pos.x(), pos.y()):
-                self._previous_photo()
-                return
-            if hasattr(self, '_play_rect') and self._play_rect.contains(pos.x(), pos.y()):
-                self._toggle_slideshow()
-                return
-            if hasattr(self, '_next_rect') and self._next_rect.contains(pos.x(), pos.y()):
-                self._next_photo()
-                return
-            if hasattr(self, '_back_rect') and self._back_rect.contains(pos.x(), pos.y()):
-                self._go_back()
-                return
+            for rect, handler in (
+                (self._prev_rect, self._previous_photo),
+                (self._play_rect, self._toggle_slideshow),
+                (self._next_rect, self._next_photo),
+                (self._back_rect, self._go_back),
+            ):
+                if rect.contains(pos.x(), pos.y()):
+                    handler()
+                    return
     
     def keyPressEvent(self, event):
         """Handle keyboard input."""
@@ -263,11 +734,13 @@ class PhotoView(QWidget):
     
     def _on_photo_changed(self, index):
         """Handle photo change from service."""
-        self._load_photo()
+        if self._active:
+            self._load_photo()
     
     def on_activate(self):
         """Called when view becomes active."""
         logger.debug("Photo view activated")
+        self._active = True
         
         # Start slideshow
         interval = self.app_state.get_setting('slideshow_interval', 5) * 1000
@@ -285,12 +758,37 @@ class PhotoView(QWidget):
     def on_deactivate(self):
         """Called when view becomes inactive."""
         logger.debug("Photo view deactivated")
+        self._active = False
         self.slideshow_timer.stop()
         self.control_timer.stop()
+        if self.resize_timer.isActive():
+            self.resize_timer.stop()
+            self._finish_resize()
+        self.prefetch_timer.stop()  # After the flush - it re-arms prefetching
     
     def resizeEvent(self, event):
         """Handle window resize."""
         super().resizeEvent(event)
-        # Reload photo to fit new size
-        if self.current_pixmap:
-            self._load_photo()
+        self._recompute_layout()
+        self._controls_cache.clear()  # Bar width changed
+        # Quick rescale of the already-decoded photo now, smooth one once
+        # resizing settles
+        if self._raw_image is not None:
+            old, new = event.oldSize(), event.size()
+            if (not old.isValid()
+                    or abs(new.width() - old.width()) > self.RESIZE_SLOP
+                    or abs(new.height() - old.height()) > self.RESIZE_SLOP):
+                self._resizing = True
+                self._rescale_and_show()
+            self.resize_timer.start()
+    
+    def _finish_resize(self):
+        """Redo the rescale at full quality after a resize burst."""
+        self._resizing = False
+        # Preloads decoded for the old size would only be thrown away on
+        # use - free those image buffers now and decode again at this size
+        box = self._photo_target_size()
+        for path in [p for p, entry in self._preloaded.items() if entry[0] != box]:
+            del self._preloaded[path]
+        self._rescale_and_show()
+        self.prefetch_timer.start()
@@ -4,16 +4,49 @@ Text-based settings with discrete bar controls.
 """
 
 import logging
-import subprocess
-from PyQt5.QtCore import Qt, QTimer, QRectF
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QMessageBox, QPushButton
-from PyQt5.QtGui import QFont, QKeyEvent, QPainter, QColor, QPen, QBrush
+import time
+from functools import partial
+from PyQt5.QtCore import Qt, QRect, QTimer, QObject, QProcess, QRunnable, QThreadPool, pyqtSignal
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtGui import QFont, QFontDatabase, QFontMetrics, QImage, QKeyEvent, QPainter, QPixmap, QColor, QPen, QBrush
 
 from models.app_state import AppState
-from config.settings_loader import save_settings
+from ui.widgets.close_button import CloseButton
 
 logger = logging.getLogger(__name__)
 
+class _SaveSignals(QObject):
+    """Carries the settings-save result back to the GUI thread."""
+    saved = pyqtSignal(bool)
+
+
+class _SaveJob(QRunnable):
+    """Write a settings snapshot on a QThreadPool thread."""
+    
+    def __init__(self, settings: dict, signals: _SaveSignals):
+        super().__init__()
+        self.settings = settings
+        self.signals = signals
+    
+    def run(self):
+        # Imported here - only needed once the user actually changes something
+        from config.settings_loader import save_settings
+        self.signals.saved.emit(save_settings(self.settings))
+
+
+def _run_detached(program: str, args: list) -> bool:
+    """Fire-and-forget a helper command, discarding its output."""
+    proc = QProcess()
+    proc.setProgram(program)
+    proc.setArguments(args)
+    proc.setStandardOutputFile(QProcess.nullDevice())
+    proc.setStandardErrorFile(QProcess.nullDevice())
+    ok, _pid = proc.startDetached()
+    if not ok:
+        logger.debug(f"{program} not available")
+    return ok
+
+
 # Add VIEW_MENU to AppState if not present
 if not hasattr(AppState, 'VIEW_MENU'):
     AppState.VIEW_MENU = 'menu'
@@ -44,6 +77,40 @@ class SettingsView(QWidget):
     ]
     
     STEPS = 10
+    WIFI_CACHE_TTL = 30  # Seconds a scan result is reused before asking nmcli again
+    WIFI_POLL_CONNECTED_MS = 60_000     # Background refresh while on a network
+    WIFI_POLL_DISCONNECTED_MS = 10_000  # ...and while still looking for one
+    
+    # Screen sections (locked layout) - handlers repaint only the one that
+    # changed and paintEvent skips those outside the dirty region
+    TITLE_RECT = QRect(60, 40, 400, 50)
+    LABEL_RECT = QRect(60, 152, 400, 38)
+    BAR_RECT = QRect(60, 220, 400, 50)
+    VALUE_RECT = QRect(60, 255, 200, 45)
+    BUTTONS_RECT = QRect(60, 325, 400, 40)
+    DEC_RECT = QRect(60, 325, 60, 40)
+    INC_RECT = QRect(400, 325, 60, 40)
+    
+    # Row layouts - text baselines and minimum row pitch (rows grow with the font)
+    MENU_Y = 150
+    MENU_SPACING = 50
+    WIFI_Y = 180
+    WIFI_SPACING = 40
+    WIFI_ROWS = 8
+    
+    # Paint resources - built once rather than on every paint
+    _COL_TITLE = QColor(224, 224, 224)
+    _COL_SELECTED = QColor(255, 255, 255)
+    _COL_UNSELECTED = QColor(128, 128, 128)
+    _COL_LABEL = QColor(160, 160, 160)
+    _COL_HINT = QColor(96, 96, 96)
+    _PEN_BAR_BORDER = QPen(QColor(80, 80, 80), 2)
+    _BRUSH_BAR_BG = QBrush(QColor(20, 20, 20))
+    _BRUSH_ON = QBrush(QColor(200, 200, 180))
+    _BRUSH_OFF = QBrush(QColor(40, 40, 40))
+    
+    # Shared across instances so re-entering the Wi-Fi editor reuses the last scan
+    _wifi_cache = {'networks': [], 'ts': 0.0}
     
     def __init__(self, app_state: AppState, navigate_callback):
         super().__init__()
@@ -56,60 +123,120 @@ class SettingsView(QWidget):
         self.brightness_level = app_state.get_setting('brightness', 80) // 10
         self.wifi_networks = []
         self.wifi_selected = 0
+        self._wifi_proc = None  # Running nmcli scan, if any
+        self._wifi_rows = []
+        self._connect_proc = None  # Running nmcli connect, if any
+        self._apply_pending = None  # Setting with a level change not yet applied
+        self._bar_block_cache = {}  # level -> (filled rects, empty rects)
+        self._bar_images = {}       # level -> pre-rendered bar
+        self._title_pixmap = None   # Pre-rendered "SETTINGS" heading
+        self._menu_cache = {}       # selected_index -> pre-rendered menu list
+        self._signal_pixmaps = {}   # (filled bars, selected) -> signal meter
+        
+        # Refreshes the list while the Wi-Fi editor is open
+        self._scan_timer = QTimer(self)
+        self._scan_timer.timeout.connect(self._refresh_wifi)
         
+        # Settings are written on the thread pool, one write at a time
+        self._save_signals = _SaveSignals()
+        self._save_signals.saved.connect(self._on_settings_saved)
+        self._save_running = False
+        self._save_again = False  # Another save was requested mid-write
+        self._settings_dirty = False  # A level changed since the last write
+        
+        self._init_fonts()
+        self._rebuild_menu_geometry()
+        self._init_keymaps()
         self._init_ui()
         self.setFocusPolicy(Qt.StrongFocus)
     
+    def _init_fonts(self):
+        """Build fonts and row metrics once instead of on every paint."""
+        # Resolve the family once - without Courier New every QFont would
+        # go through the alias fallback, so use the system monospace instead
+        if "Courier New" in QFontDatabase().families():
+            def mono(size, weight=QFont.Normal):
+                return QFont("Courier New", size, weight)
+        else:
+            def mono(size, weight=QFont.Normal):
+                font = QFontDatabase.systemFont(QFontDatabase.FixedFont)
+                font.setPointSize(size)
+                font.setWeight(weight)
+                return font
+        
+        self._font_title = mono(32, QFont.Bold)
+        self._font_menu = mono(24)
+        self._font_bar_label = mono(18)
+        self._font_value = mono(24)
+        self._font_buttons = mono(16)
+        self._font_wifi = mono(18)
+        self._font_hint = mono(14)
+        
+        # Row pitch and hit areas follow the actual glyph metrics
+        self._fm_menu = QFontMetrics(self._font_menu)
+        self._fm_wifi = QFontMetrics(self._font_wifi)
+        self._menu_spacing = max(self.MENU_SPACING, self._fm_menu.lineSpacing())
+        self._wifi_spacing = max(self.WIFI_SPACING, self._fm_wifi.lineSpacing())
+        # Baseline -> row top, centring the glyph box in the row
+        self._menu_row_offset = (self._fm_menu.ascent()
+                                 + (self._menu_spacing - self._fm_menu.height()) // 2)
+        self._wifi_row_offset = (self._fm_wifi.ascent()
+                                 + (self._wifi_spacing - self._fm_wifi.height()) // 2)
+        # Signal meters sit in a fixed column after the padded SSID
+        self._wifi_bars_x = 60 + self._fm_wifi.horizontalAdvance("▶ " + " " * 23)
+    
     def _init_ui(self):
         """Initialize UI components."""
-        self.setStyleSheet("background-color: #000000;")
+        # paintEvent fills its own black background, so Qt can skip erasing
+        # the widget first (and no stylesheet polish on every paint)
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+        self.setAutoFillBackground(False)
         
         # Close button in top-right corner (consistent with other views)
-        self.close_btn = QPushButton("✕", self)
-        self.close_btn.setFixedSize(50, 50)
-        self.close_btn.setFont(QFont("Arial", 20, QFont.Bold))
+        self.close_btn = CloseButton(self)
         self.close_btn.clicked.connect(lambda: self._go_back())
-        self.close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #F44336;
-                color: white;
-                border-radius: 25px;
-                border: none;
-            }
-            QPushButton:pressed {
-                background-color: #D32F2F;
-            }
-        """)
         # We use paintEvent for full control
     
     def paintEvent(self, event):
-        """Paint the settings interface."""
-        super().paintEvent(event)
-        
+        """Paint the settings interface, skipping sections outside the dirty region."""
         painter = QPainter(self)
+        # Opaque widget - clear just the dirty area ourselves
+        painter.fillRect(event.rect(), Qt.black)
         painter.setRenderHint(QPainter.Antialiasing)
+        region = event.region()
         
         # Title
-        painter.setPen(QColor(224, 224, 224))
-        font = QFont("Courier New", 32, QFont.Bold)
-        painter.setFont(font)
-        painter.drawText(60, 80, "SETTINGS")
+        if region.intersects(self.TITLE_RECT):
+            if self._title_pixmap is None:
+                self._title_pixmap = self._render_title()
+            painter.drawPixmap(self.TITLE_RECT.topLeft(), self._title_pixmap)
         
         if self.editing_setting:
-            self._draw_setting_editor(painter)
+            self._draw_setting_editor(painter, region)
         else:
-            self._draw_menu(painter)
+            menu_rect = self._menu_rect()
+            if region.intersects(menu_rect):
+                menu = self._menu_cache.get(self.selected_index)
+                if menu is None:
+                    menu = self._menu_cache[self.selected_index] = self._render_menu()
+                painter.drawPixmap(menu_rect.topLeft(), menu)
         
         # Hint at bottom
-        if self.editing_setting:
+        hint_rect = self._hint_rect()
+        if not region.intersects(hint_rect):
+            return
+        
+        if self.editing_setting == 'wifi':
+            hint = "[↑/↓] Select   [R] Rescan   [BACK] Return"
+        elif self.editing_setting:
             hint = "[←/→] Adjust   [BACK] Return"
         else:
             hint = "[TAP] Edit   [BACK] Menu"
         
-        painter.setPen(QColor(96, 96, 96))
-        font = QFont("Courier New", 14)
-        painter.setFont(font)
-        painter.drawText(0, self.height() - 40, self.width(), 30, Qt.AlignCenter, hint)
+        painter.setPen(self._COL_HINT)
+        painter.setFont(self._font_hint)
+        painter.drawText(hint_rect, Qt.AlignCenter, hint)
     
     def resizeEvent(self, event):
         """Handle resize to position close button."""
@@ -117,176 +244,370 @@ class SettingsView(QWidget):
         # Position close button in top-right corner
         self.close_btn.move(self.width() - 60 - 50, 10)
     
-    def _draw_menu(self, painter):
-        """Draw the settings menu list."""
-        y = 150
+    def _hint_rect(self):
+        """Bottom hint line - follows the widget height."""
+        return QRect(0, self.height() - 40, self.width(), 30)
+    
+    def _rebuild_menu_geometry(self):
+        """Lay out the menu rows once; painting, repaints and taps all share them."""
+        first_top = self.MENU_Y - self._menu_row_offset
+        self._menu_item_rects = [
+            QRect(60, first_top + i * self._menu_spacing, 420, self._menu_spacing)
+            for i in range(len(self.MENU_ITEMS))
+        ]
+        self._menu_area = self._menu_item_rects[0].united(self._menu_item_rects[-1])
+        self._menu_cache.clear()
+    
+    def _menu_row_rect(self, index):
+        """Area (and tap target) of one settings menu row."""
+        return self._menu_item_rects[index]
+    
+    def _menu_rect(self):
+        """Area covered by the whole settings menu."""
+        return self._menu_area
+    
+    def _menu_index_at(self, pos):
+        """Menu row under a tap, or None - rows are evenly spaced, so no per-row scan."""
+        menu_rect = self._menu_rect()
+        if not menu_rect.contains(pos):
+            return None
+        return (pos.y() - menu_rect.y()) // self._menu_spacing
+    
+    def _wifi_row_rect(self, index):
+        """Area of one Wi-Fi network row."""
+        top = self.WIFI_Y + index * self._wifi_spacing - self._wifi_row_offset
+        return QRect(60, top, 620, self._wifi_spacing)
+    
+    def _wifi_list_rect(self):
+        """Area covered by the whole Wi-Fi network list."""
+        top = self.WIFI_Y - self._wifi_row_offset
+        return QRect(60, top, 620, self.WIFI_ROWS * self._wifi_spacing)
+    
+    def _level_rect(self):
+        """Bar (plus its 2px outline) and the percentage below it."""
+        return self.BAR_RECT.adjusted(-1, -1, 1, 1).united(self.VALUE_RECT)
+    
+    def _render_title(self):
+        """Render the "SETTINGS" heading into a pixmap."""
+        pixmap = QPixmap(self.TITLE_RECT.size())
+        pixmap.fill(Qt.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.translate(-self.TITLE_RECT.topLeft())
+        painter.setPen(self._COL_TITLE)
+        painter.setFont(self._font_title)
+        painter.drawText(60, 80, "SETTINGS")
+        painter.end()
+        
+        return pixmap
+    
+    def _render_menu(self):
+        """Render the settings menu list, with the current selection, into a pixmap."""
+        menu_rect = self._menu_rect()
+        pixmap = QPixmap(menu_rect.size())
+        pixmap.fill(Qt.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        # Rows are laid out in widget coordinates
+        painter.translate(-menu_rect.topLeft())
+        painter.setFont(self._font_menu)
         
         for i, (name, _) in enumerate(self.MENU_ITEMS):
             if i == self.selected_index:
                 text = f"▶ {name}"
-                color = QColor(255, 255, 255)
+                color = self._COL_SELECTED
             else:
                 text = f"  {name}"
-                color = QColor(128, 128, 128)
+                color = self._COL_UNSELECTED
             
             painter.setPen(color)
-            font = QFont("Courier New", 24)
-            painter.setFont(font)
-            painter.drawText(60, y, text)
-            
-            y += 50
+            painter.drawText(self._menu_item_rects[i], Qt.AlignLeft | Qt.AlignVCenter, text)
+        painter.end()
+        
+        return pixmap
     
-    def _draw_setting_editor(self, painter):
+    def _draw_setting_editor(self, painter, region):
         """Draw the setting editor view."""
         if self.editing_setting == 'volume':
-            self._draw_bar_editor(painter, "VOLUME", self.volume_level)
+            self._draw_bar_editor(painter, region, "VOLUME", self.volume_level)
         elif self.editing_setting == 'brightness':
-            self._draw_bar_editor(painter, "BRIGHTNESS", self.brightness_level)
+            self._draw_bar_editor(painter, region, "BRIGHTNESS", self.brightness_level)
         elif self.editing_setting == 'wifi':
-            self._draw_wifi_editor(painter)
+            self._draw_wifi_editor(painter, region)
     
-    def _draw_bar_editor(self, painter, label, level):
+    def _draw_bar_editor(self, painter, region, label, level):
         """Draw a bar-style discrete editor."""
-        y = 180
-        
         # Label
-        painter.setPen(QColor(160, 160, 160))
-        font = QFont("Courier New", 18)
-        painter.setFont(font)
-        painter.drawText(60, y, label)
+        if region.intersects(self.LABEL_RECT):
+            painter.setPen(self._COL_LABEL)
+            painter.setFont(self._font_bar_label)
+            painter.drawText(60, 180, label)
+        
+        # Bar - a single blit of the pre-rendered image for this level
+        bar_area = self.BAR_RECT.adjusted(-1, -1, 1, 1)
+        if region.intersects(bar_area):
+            painter.drawImage(bar_area.topLeft(), self._bar_image(level))
         
-        y += 40
+        # Value display
+        if region.intersects(self.VALUE_RECT):
+            painter.setPen(self._COL_TITLE)
+            painter.setFont(self._font_value)
+            painter.drawText(60, 290, f"{level * 10}%")
+        
+        # Instructions
+        if region.intersects(self.BUTTONS_RECT):
+            painter.setPen(self._COL_UNSELECTED)
+            painter.setFont(self._font_buttons)
+            painter.drawText(60, 350, "[ − ]              [ + ]")
+    
+    def _bar_image(self, level):
+        """Whole bar (outline, background, blocks) for a level, rendered once."""
+        image = self._bar_images.get(level)
+        if image is None:
+            image = self._bar_images[level] = self._render_bar(level)
+        return image
+    
+    def _render_bar(self, level):
+        """Render the bar at its final size - the 2px outline reaches 1px outside BAR_RECT."""
+        bar_area = self.BAR_RECT.adjusted(-1, -1, 1, 1)
+        image = QImage(bar_area.size(), QImage.Format_RGB32)
+        image.fill(Qt.black)
         
-        # Bar
-        bar_x = 60
-        bar_w = 400
-        bar_h = 50
-        block_w = bar_w // self.STEPS
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.translate(-bar_area.topLeft())
         
         # Background
-        painter.setPen(QPen(QColor(80, 80, 80), 2))
-        painter.setBrush(QBrush(QColor(20, 20, 20)))
-        painter.drawRect(bar_x, y, bar_w, bar_h)
+        painter.setPen(self._PEN_BAR_BORDER)
+        painter.setBrush(self._BRUSH_BAR_BG)
+        painter.drawRect(self.BAR_RECT)
         
-        # Blocks
+        # Blocks - one batched draw per brush
+        filled, empty = self._bar_blocks(level)
         painter.setPen(Qt.NoPen)
-        for i in range(self.STEPS):
-            if i < level:
-                painter.setBrush(QBrush(QColor(200, 200, 180)))
-            else:
-                painter.setBrush(QBrush(QColor(40, 40, 40)))
-            painter.drawRect(bar_x + i * block_w + 4, y + 4, block_w - 8, bar_h - 8)
+        if filled:
+            painter.setBrush(self._BRUSH_ON)
+            painter.drawRects(filled)
+        if empty:
+            painter.setBrush(self._BRUSH_OFF)
+            painter.drawRects(empty)
+        painter.end()
         
-        # Value display
-        y += 70
-        painter.setPen(QColor(224, 224, 224))
-        font = QFont("Courier New", 24)
-        painter.setFont(font)
-        painter.drawText(60, y, f"{level * 10}%")
-        
-        # Instructions
-        y += 60
-        painter.setPen(QColor(128, 128, 128))
-        font = QFont("Courier New", 16)
-        painter.setFont(font)
-        painter.drawText(60, y, "[ − ]              [ + ]")
-        
-        # Store rects for click detection
-        self._dec_rect = QRectF(60, y - 25, 60, 40)
-        self._inc_rect = QRectF(bar_x + bar_w - 60, y - 25, 60, 40)
-        self._bar_rect = QRectF(bar_x, 220, bar_w, bar_h)
-    
-    def _draw_wifi_editor(self, painter):
+        return image
+    
+    def _bar_blocks(self, level):
+        """(filled, empty) block rects for a level - only STEPS + 1 variants exist."""
+        blocks = self._bar_block_cache.get(level)
+        if blocks is None:
+            bar_x = self.BAR_RECT.x()
+            bar_y = self.BAR_RECT.y()
+            bar_h = self.BAR_RECT.height()
+            block_w = self.BAR_RECT.width() // self.STEPS
+            rects = [
+                QRect(bar_x + i * block_w + 4, bar_y + 4, block_w - 8, bar_h - 8)
+                for i in range(self.STEPS)
+            ]
+            blocks = self._bar_block_cache[level] = (rects[:level], rects[level:])
+        return blocks
+    
+    def _draw_wifi_editor(self, painter, region):
         """Draw WiFi network list."""
-        y = 180
+        y = self.WIFI_Y
+        spacing = self._wifi_spacing
+        painter.setFont(self._font_wifi)
         
-        # Scan networks if empty
         if not self.wifi_networks:
-            self._scan_wifi()
-        
-        if not self.wifi_networks:
-            painter.setPen(QColor(128, 128, 128))
-            font = QFont("Courier New", 18)
-            painter.setFont(font)
-            painter.drawText(60, y, "No networks found")
-            painter.drawText(60, y + 40, "Scanning...")
+            painter.setPen(self._COL_UNSELECTED)
+            if self._wifi_proc is not None:
+                painter.drawText(60, y, "Scanning...")
+            else:
+                painter.drawText(60, y, "No networks found")
             return
         
-        for i, network in enumerate(self.wifi_networks[:8]):
+        for i, network in enumerate(self.wifi_networks[:self.WIFI_ROWS]):
+            if not region.intersects(self._wifi_row_rect(i)):
+                y += spacing
+                continue
+            
             ssid = network.get('ssid', 'Unknown')
             signal = network.get('signal', 0)
             connected = network.get('connected', False)
             
             if i == self.wifi_selected:
                 prefix = "▶ "
-                color = QColor(255, 255, 255)
+                color = self._COL_SELECTED
             else:
                 prefix = "  "
-                color = QColor(128, 128, 128)
+                color = self._COL_UNSELECTED
             
             # SSID
             if len(ssid) > 20:
                 ssid = ssid[:17] + "..."
             
+            painter.setPen(color)
+            painter.drawText(60, y, f"{prefix}{ssid}")
+            
             # Signal bars
-            bars = self._signal_to_bars(signal)
+            meter = self._signal_pixmap(self._signal_to_bars(signal), i == self.wifi_selected)
+            painter.drawPixmap(self._wifi_bars_x, y - self._fm_wifi.ascent(), meter)
             
             # Connected indicator
-            status = " ✓" if connected else ""
-            
-            text = f"{prefix}{ssid:<22} {bars}{status}"
-            
-            painter.setPen(color)
-            font = QFont("Courier New", 18)
-            painter.setFont(font)
-            painter.drawText(60, y, text)
+            if connected:
+                painter.drawText(self._wifi_bars_x + meter.width(), y, " ✓")
             
-            y += 40
+            y += spacing
     
     def _signal_to_bars(self, signal):
-        """Convert signal strength to bar display."""
+        """Convert signal strength to a number of filled bars (0-4)."""
         if signal >= 80:
-            return "████"
+            return 4
         elif signal >= 60:
-            return "███░"
+            return 3
         elif signal >= 40:
-            return "██░░"
+            return 2
         elif signal >= 20:
-            return "█░░░"
+            return 1
         else:
-            return "░░░░"
+            return 0
     
-    def _scan_wifi(self):
-        """Scan for WiFi networks."""
-        self.wifi_networks = []
+    def _signal_pixmap(self, bars, selected):
+        """Four-cell signal meter, pre-rendered once per bar count and row colour."""
+        key = (bars, selected)
+        pixmap = self._signal_pixmaps.get(key)
+        if pixmap is None:
+            pixmap = self._signal_pixmaps[key] = self._render_signal(bars, selected)
+        return pixmap
+    
+    def _render_signal(self, bars, selected):
+        """Draw a meter the size of four text cells: solid blocks, then shaded ones."""
+        cell_w = self._fm_wifi.horizontalAdvance("█")
+        cell_h = self._fm_wifi.height()
+        pixmap = QPixmap(cell_w * 4, cell_h)
+        pixmap.fill(Qt.transparent)
         
-        try:
-            # Try nmcli on Linux
-            result = subprocess.run(
-                ['nmcli', '-t', '-f', 'SSID,SIGNAL,ACTIVE', 'device', 'wifi', 'list'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            
-            if result.returncode == 0:
-                for line in result.stdout.strip().split('\n'):
-                    if line:
-                        parts = line.split(':')
-                        if len(parts) >= 3 and parts[0]:
-                            self.wifi_networks.append({
-                                'ssid': parts[0],
-                                'signal': int(parts[1]) if parts[1].isdigit() else 0,
-                                'connected': parts[2] == 'yes'
-                            })
-        except Exception as e:
-            logger.debug(f"WiFi scan not available: {e}")
-            # Add dummy data for testing
-            self.wifi_networks = [
-                {'ssid': 'Home_Network', 'signal': 85, 'connected': True},
-                {'ssid': 'Neighbor_5G', 'signal': 45, 'connected': False},
-                {'ssid': 'Guest_WiFi', 'signal': 30, 'connected': False},
-            ]
+        color = self._COL_SELECTED if selected else self._COL_UNSELECTED
+        shade = QColor(color)
+        shade.setAlpha(64)  # Reads like the old "░" glyph
+        
+        painter = QPainter(pixmap)
+        for i in range(4):
+            painter.fillRect(i * cell_w, 0, cell_w, cell_h, color if i < bars else shade)
+        painter.end()
+        
+        return pixmap
+    
+    def _scan_wifi(self, force=False):
+        """Refresh the network list from nmcli without blocking the GUI thread.
+        
+        A recent result is reused unless force is set; only a forced scan
+        asks nmcli to rescan the radio, which can take several seconds.
+        """
+        cache = SettingsView._wifi_cache
+        if not force and cache['networks'] and time.monotonic() - cache['ts'] < self.WIFI_CACHE_TTL:
+            self.wifi_networks = cache['networks']
+            return
+        
+        if self._wifi_proc is not None:
+            return  # A scan is already in flight
+        
+        self._wifi_rows = []  # Networks parsed so far from this scan
+        self._wifi_proc = QProcess(self)
+        self._wifi_proc.readyReadStandardOutput.connect(self._on_wifi_scan_output)
+        self._wifi_proc.finished.connect(self._on_wifi_scan_done)
+        self._wifi_proc.errorOccurred.connect(self._on_wifi_scan_error)
+        self._wifi_proc.start('nmcli', [
+            '-t', '-f', 'SSID,SIGNAL,ACTIVE', 'device', 'wifi', 'list',
+            '--rescan', 'yes' if force else 'no',
+        ])
+        self.update(self._wifi_list_rect())
+    
+    def _on_wifi_scan_output(self):
+        """Parse nmcli rows as they arrive; stop it once the editor's rows are filled."""
+        proc = self._wifi_proc
+        if proc is None:
+            return
+        while proc.canReadLine():
+            if self._add_wifi_row(bytes(proc.readLine())):
+                # Crowded area - no need to read (or keep) the rest
+                self._wifi_proc = None
+                proc.blockSignals(True)  # Killing it is not a failed scan
+                proc.kill()
+                proc.deleteLater()
+                self._set_wifi_networks(self._wifi_rows)
+                return
+    
+    def _on_wifi_scan_done(self, exit_code, exit_status):
+        """Finish parsing once the scan process exits."""
+        proc, self._wifi_proc = self._wifi_proc, None
+        if proc is None:
+            return
+        rest = bytes(proc.readAllStandardOutput())
+        proc.deleteLater()
+        
+        if exit_status != QProcess.NormalExit or exit_code != 0:
+            logger.debug(f"WiFi scan failed (exit code: {exit_code})")
+            self.update(self._wifi_list_rect())
+            return
+        
+        # Whatever readyRead didn't consume (e.g. a last line without newline)
+        for line in rest.splitlines():
+            if self._add_wifi_row(line):
+                break
+        # Swap in the finished list in one go
+        self._set_wifi_networks(self._wifi_rows)
+    
+    def _add_wifi_row(self, raw):
+        """Parse one nmcli line into _wifi_rows; True once the visible rows are filled."""
+        # Lines are SSID:SIGNAL:ACTIVE; split from the right since only the
+        # SSID can contain (backslash-escaped) colons
+        line = raw.decode('utf-8', 'replace').rstrip('\r\n')
+        rest, _, active = line.rpartition(':')
+        ssid, _, signal = rest.rpartition(':')
+        if ssid:
+            self._wifi_rows.append({
+                'ssid': ssid.replace('\\:', ':'),
+                'signal': int(signal) if signal.isdigit() else 0,
+                'connected': active == 'yes'
+            })
+        return len(self._wifi_rows) >= self.WIFI_ROWS
+    
+    def _on_wifi_scan_error(self, error):
+        """nmcli could not be started - fall back to sample networks."""
+        if error != QProcess.FailedToStart:
+            return  # finished() follows for every other error
+        proc, self._wifi_proc = self._wifi_proc, None
+        if proc is not None:
+            proc.deleteLater()
+        logger.debug("WiFi scan not available: nmcli failed to start")
+        # Add dummy data for testing
+        self._set_wifi_networks([
+            {'ssid': 'Home_Network', 'signal': 85, 'connected': True},
+            {'ssid': 'Neighbor_5G', 'signal': 45, 'connected': False},
+            {'ssid': 'Guest_WiFi', 'signal': 30, 'connected': False},
+        ])
+    
+    def _set_wifi_networks(self, networks):
+        """Store a scan result in the shared cache and redraw."""
+        SettingsView._wifi_cache = {'networks': networks, 'ts': time.monotonic()}
+        self.wifi_networks = networks
+        if self.wifi_selected >= len(networks):
+            self.wifi_selected = 0
+        if self._scan_timer.isActive():
+            self._scan_timer.setInterval(self._wifi_poll_interval())
+        self.update(self._wifi_list_rect())
+    
+    def _wifi_poll_interval(self):
+        """Poll slowly once connected, faster while no network is active."""
+        if any(n.get('connected') for n in self.wifi_networks):
+            return self.WIFI_POLL_CONNECTED_MS
+        return self.WIFI_POLL_DISCONNECTED_MS
+    
+    def _refresh_wifi(self):
+        """Re-read nmcli's network list, bypassing the cache but not rescanning."""
+        SettingsView._wifi_cache['ts'] = float('-inf')
+        self._scan_wifi()
     
     def mousePressEvent(self, event):
         """Handle mouse clicks."""
@@ -294,72 +615,106 @@ class SettingsView(QWidget):
         
         if self.editing_setting in ('volume', 'brightness'):
             # Check increment/decrement buttons
-            if hasattr(self, '_dec_rect') and self._dec_rect.contains(pos.x(), pos.y()):
+            if self.DEC_RECT.contains(pos):
                 self._adjust_level(-1)
                 return
-            if hasattr(self, '_inc_rect') and self._inc_rect.contains(pos.x(), pos.y()):
+            if self.INC_RECT.contains(pos):
                 self._adjust_level(1)
                 return
-            if hasattr(self, '_bar_rect') and self._bar_rect.contains(pos.x(), pos.y()):
+            if self.BAR_RECT.contains(pos):
                 # Click on bar to set level
-                rel_x = pos.x() - self._bar_rect.x()
-                level = int((rel_x / self._bar_rect.width()) * self.STEPS)
+                rel_x = pos.x() - self.BAR_RECT.x()
+                level = int((rel_x / self.BAR_RECT.width()) * self.STEPS)
                 level = max(0, min(self.STEPS, level))
                 if self.editing_setting == 'volume':
                     self.volume_level = level
                 else:
                     self.brightness_level = level
-                self._apply_setting()
+                self._schedule_apply()
                 return
         
         if not self.editing_setting:
             # Check if clicked on a menu item
-            y = 125
-            for i, _ in enumerate(self.MENU_ITEMS):
-                item_rect = QRectF(60, y, 400, 45)
-                if item_rect.contains(pos.x(), pos.y()):
-                    self.selected_index = i
-                    self._enter_setting()
-                    return
-                y += 50
+            index = self._menu_index_at(pos)
+            if index is not None:
+                self.selected_index = index
+                self._enter_setting()
+                return
         
         # Click elsewhere goes back
         self._go_back()
     
+    def _init_keymaps(self):
+        """Key -> handler tables, one per mode, so a key press is one dict lookup."""
+        self._keymap_menu = {
+            Qt.Key_Up: self._menu_up,
+            Qt.Key_Down: self._menu_down,
+            Qt.Key_Return: self._enter_setting,
+            Qt.Key_Enter: self._enter_setting,
+            Qt.Key_Space: self._enter_setting,
+            Qt.Key_Escape: self._go_back,
+        }
+        self._keymap_level = {
+            Qt.Key_Escape: self._exit_setting,
+            Qt.Key_Backspace: self._exit_setting,
+            Qt.Key_Left: partial(self._adjust_level, -1),
+            Qt.Key_Right: partial(self._adjust_level, 1),
+        }
+        self._keymap_wifi = {
+            Qt.Key_Escape: self._exit_setting,
+            Qt.Key_Backspace: self._exit_setting,
+            Qt.Key_Up: self._wifi_up,
+            Qt.Key_Down: self._wifi_down,
+            Qt.Key_Return: self._connect_wifi,
+            Qt.Key_Enter: self._connect_wifi,
+            Qt.Key_R: partial(self._scan_wifi, force=True),
+        }
+    
     def keyPressEvent(self, event: QKeyEvent):
         """Handle keyboard navigation."""
-        key = event.key()
-        
-        if self.editing_setting:
-            if key == Qt.Key_Escape or key == Qt.Key_Backspace:
-                self._exit_setting()
-            elif key == Qt.Key_Left:
-                self._adjust_level(-1)
-            elif key == Qt.Key_Right:
-                self._adjust_level(1)
-            elif key == Qt.Key_Up and self.editing_setting == 'wifi':
-                if self.wifi_networks:
-                    self.wifi_selected = (self.wifi_selected - 1) % len(self.wifi_networks)
-                    self.update()
-            elif key == Qt.Key_Down and self.editing_setting == 'wifi':
-                if self.wifi_networks:
-                    self.wifi_selected = (self.wifi_selected + 1) % len(self.wifi_networks)
-                    self.update()
-            elif key in (Qt.Key_Return, Qt.Key_Enter) and self.editing_setting == 'wifi':
-                self._connect_wifi()
+        if self.editing_setting == 'wifi':
+            keymap = self._keymap_wifi
+        elif self.editing_setting:
+            keymap = self._keymap_level
         else:
-            if key == Qt.Key_Up:
-                self.selected_index = (self.selected_index - 1) % len(self.MENU_ITEMS)
-                self.update()
-            elif key == Qt.Key_Down:
-                self.selected_index = (self.selected_index + 1) % len(self.MENU_ITEMS)
-                self.update()
-            elif key in (Qt.Key_Return, Qt.Key_Enter, Qt.Key_Space):
-                self._enter_setting()
-            elif key == Qt.Key_Escape:
-                self._go_back()
-            else:
-                super().keyPressEvent(event)
+            keymap = self._keymap_menu
+        
+        handler = keymap.get(event.key())
+        if handler is not None:
+            handler()
+        elif not self.editing_setting:
+            super().keyPressEvent(event)
+        # Other keys are swallowed while a setting is being edited
+    
+    def _menu_up(self):
+        """Move the menu cursor up."""
+        self._select_menu((self.selected_index - 1) % len(self.MENU_ITEMS))
+    
+    def _menu_down(self):
+        """Move the menu cursor down."""
+        self._select_menu((self.selected_index + 1) % len(self.MENU_ITEMS))
+    
+    def _wifi_up(self):
+        """Move the Wi-Fi cursor up."""
+        if self.wifi_networks:
+            self._select_wifi((self.wifi_selected - 1) % len(self.wifi_networks))
+    
+    def _wifi_down(self):
+        """Move the Wi-Fi cursor down."""
+        if self.wifi_networks:
+            self._select_wifi((self.wifi_selected + 1) % len(self.wifi_networks))
+    
+    def _select_menu(self, index):
+        """Move the menu cursor, repainting just the two affected rows."""
+        self.update(self._menu_row_rect(self.selected_index))
+        self.selected_index = index
+        self.update(self._menu_row_rect(index))
+    
+    def _select_wifi(self, index):
+        """Move the Wi-Fi cursor, repainting just the two affected rows."""
+        self.update(self._wifi_row_rect(self.wifi_selected))
+        self.wifi_selected = index
+        self.update(self._wifi_row_rect(index))
     
     def _enter_setting(self):
         """Enter a setting for editing."""
@@ -369,11 +724,14 @@ class SettingsView(QWidget):
         if setting_id == 'wifi':
             self.wifi_selected = 0
             self._scan_wifi()
+            self._scan_timer.start(self._wifi_poll_interval())
         
         self.update()
     
     def _exit_setting(self):
         """Exit setting editing."""
+        self._scan_timer.stop()
+        self._flush_apply()  # Save must see a level changed this event-loop turn
         self._save_settings()
         self.editing_setting = None
         self.update()
@@ -385,56 +743,100 @@ class SettingsView(QWidget):
         elif self.editing_setting == 'brightness':
             self.brightness_level = max(0, min(self.STEPS, self.brightness_level + delta))
         
-        self._apply_setting()
-        self.update()
+        self._schedule_apply()
     
-    def _apply_setting(self):
-        """Apply the current setting immediately."""
-        if self.editing_setting == 'volume':
+    def _schedule_apply(self):
+        """Apply and repaint once all queued input has been handled."""
+        if self._apply_pending is None:
+            QTimer.singleShot(0, self._flush_apply)
+        self._apply_pending = self.editing_setting
+    
+    def _flush_apply(self):
+        """Push the latest level to the system and redraw the bar, once."""
+        setting, self._apply_pending = self._apply_pending, None
+        if setting is None:
+            return
+        self._apply_setting(setting)
+        self.update(self._level_rect())
+    
+    def _apply_setting(self, setting):
+        """Apply a setting's current level immediately."""
+        if setting == 'volume':
             volume = self.volume_level * 10
             self.app_state.set_setting('volume', volume)
+            self._settings_dirty = True
             # Apply system volume if possible
-            try:
-                subprocess.run(['amixer', 'sset', 'Master', f'{volume}%'], 
-                             capture_output=True, timeout=2)
-            except:
-                pass
-        elif self.editing_setting == 'brightness':
+            _run_detached('amixer', ['sset', 'Master', f'{volume}%'])
+        elif setting == 'brightness':
             brightness = self.brightness_level * 10
             self.app_state.set_setting('brightness', brightness)
+            self._settings_dirty = True
             # Apply system brightness if possible
-            try:
-                subprocess.run(['brightnessctl', 'set', f'{brightness}%'],
-                             capture_output=True, timeout=2)
-            except:
-                pass
+            _run_detached('brightnessctl', ['set', f'{brightness}%'])
     
     def _connect_wifi(self):
         """Connect to selected WiFi network."""
         if not self.wifi_networks or self.wifi_selected >= len(self.wifi_networks):
             return
+        if self._connect_proc is not None:
+            return  # Still waiting on the previous attempt
         
         network = self.wifi_networks[self.wifi_selected]
         ssid = network.get('ssid', '')
         
         logger.info(f"Connecting to WiFi: {ssid}")
         
-        try:
-            subprocess.run(['nmcli', 'device', 'wifi', 'connect', ssid],
-                         capture_output=True, timeout=10)
-            self._scan_wifi()
-            self.update()
-        except Exception as e:
-            logger.error(f"WiFi connection failed: {e}")
+        self._connect_proc = QProcess(self)
+        self._connect_proc.finished.connect(self._on_wifi_connect_done)
+        self._connect_proc.errorOccurred.connect(self._on_wifi_connect_error)
+        self._connect_proc.start('nmcli', ['device', 'wifi', 'connect', ssid])
+    
+    def _on_wifi_connect_done(self, exit_code, exit_status):
+        """nmcli connect finished - refresh which network is active."""
+        proc, self._connect_proc = self._connect_proc, None
+        if proc is None:
+            return
+        if exit_status != QProcess.NormalExit or exit_code != 0:
+            error = bytes(proc.readAllStandardError()).decode('utf-8', 'replace').strip()
+            logger.error(f"WiFi connection failed: {error or exit_code}")
+        proc.deleteLater()
+        
+        # The active network changed - re-read nmcli's list, no radio rescan
+        self._refresh_wifi()
+    
+    def _on_wifi_connect_error(self, error):
+        """nmcli could not be started for a connect."""
+        if error != QProcess.FailedToStart:
+            return  # finished() follows for every other error
+        proc, self._connect_proc = self._connect_proc, None
+        if proc is not None:
+            proc.deleteLater()
+        logger.error("WiFi connection failed: nmcli not available")
     
     def _save_settings(self):
-        """Save settings to file."""
-        try:
-            settings = self.app_state.get_all_settings()
-            save_settings(settings)
-            logger.info("Settings saved")
-        except Exception as e:
-            logger.error(f"Failed to save settings: {e}")
+        """Save settings to file without blocking the GUI thread."""
+        if not self._settings_dirty:
+            return  # Only browsed - nothing to write
+        if self._save_running:
+            # Don't stack writes - save the latest state once this one lands
+            self._save_again = True
+            return
+        self._settings_dirty = False
+        self._save_running = True
+        QThreadPool.globalInstance().start(
+            _SaveJob(self.app_state.get_all_settings(), self._save_signals)
+        )
+    
+    def _on_settings_saved(self, ok):
+        """Background save finished (GUI thread)."""
+        self._save_running = False
+        if ok:
+            logger.info("Settings saved")  # save_settings logs its own failures
+        else:
+            self._settings_dirty = True  # Try again on the next save
+        if self._save_again:
+            self._save_again = False
+            self._save_settings()
     
     def _go_back(self):
         """Go back."""
@@ -456,4 +858,6 @@ class SettingsView(QWidget):
     def on_deactivate(self):
         """Called when view becomes inactive."""
         logger.debug("Settings view deactivated")
+        self._scan_timer.stop()
+        self._flush_apply()
         self._save_settings()
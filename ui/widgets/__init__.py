@@ -3,5 +3,7 @@ UI Widgets Package
 """
 
 from ui.widgets.message_overlay import MessageOverlay
+from ui.widgets.close_button import CloseButton
+from ui.widgets.retro_font import retro_font
 
-__all__ = ['MessageOverlay']
+__all__ = ['MessageOverlay', 'CloseButton', 'retro_font']
@@ -0,0 +1,33 @@
+"""
+Close Button Widget
+Round red "✕" button shown in the top-right corner of menu-level views.
+"""
+
+from PyQt5.QtWidgets import QPushButton
+from PyQt5.QtGui import QFont
+
+
+# Shared by every close button - one copy of the QSS instead of one per view
+CLOSE_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #F44336;
+        color: white;
+        border-radius: 25px;
+        border: none;
+    }
+    QPushButton:pressed {
+        background-color: #D32F2F;
+    }
+"""
+
+
+class CloseButton(QPushButton):
+    """Fixed-size 50x50 round close button."""
+
+    SIZE = 50
+
+    def __init__(self, parent=None):
+        super().__init__("✕", parent)
+        self.setFixedSize(self.SIZE, self.SIZE)
+        self.setFont(QFont("Arial", 20, QFont.Bold))
+        self.setStyleSheet(CLOSE_BUTTON_STYLE)
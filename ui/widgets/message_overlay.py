@@ -6,7 +6,7 @@ Full-screen message overlay that blocks all interaction.
 import logging
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel
-from PyQt5.QtGui import QFont
+from PyQt5.QtGui import QFont, QFontMetrics, QPainter, QPixmap, QColor
 from PyQt5.QtMultimedia import QSound
 
 logger = logging.getLogger(__name__)
@@ -27,15 +27,22 @@ class MessageOverlay(QWidget):
         super().__init__(parent)
         self.title = ""
         self.body = ""
-        self.auto_dismiss_timer = None
+        
+        # One timer for the overlay's lifetime, restarted per message
+        self.auto_dismiss_timer = QTimer(self)
+        self.auto_dismiss_timer.setSingleShot(True)
+        self.auto_dismiss_timer.timeout.connect(self.dismiss)
         
         self._init_ui()
         self.hide()  # Hidden by default
     
     def _init_ui(self):
         """Initialize UI components."""
-        # Full screen, pure black background
-        self.setStyleSheet("background-color: #000000;")
+        # Full screen, pure black background - filled by paintEvent, so Qt
+        # can skip erasing the widget first
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+        self.setAutoFillBackground(False)
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(60, 60, 60, 60)
@@ -48,10 +55,11 @@ class MessageOverlay(QWidget):
         header.setAlignment(Qt.AlignLeft)
         layout.addWidget(header)
         
-        # Separator line
-        separator = QLabel("─" * 40)
-        separator.setFont(QFont("Courier New", 16))
-        separator.setStyleSheet("color: #606060; background: transparent;")
+        # Separator line - rendered once, the label just blits the pixmap
+        self._separator_pixmap = self._render_separator(QFont("Courier New", 16))
+        separator = QLabel()
+        separator.setPixmap(self._separator_pixmap)
+        separator.setStyleSheet("background: transparent;")
         layout.addWidget(separator)
         
         layout.addSpacing(40)
@@ -83,6 +91,22 @@ class MessageOverlay(QWidget):
         self.hint_label.setAlignment(Qt.AlignLeft)
         layout.addWidget(self.hint_label)
     
+    @staticmethod
+    def _render_separator(font: QFont) -> QPixmap:
+        """Draw the "─" rule into a transparent pixmap."""
+        text = "─" * 40
+        metrics = QFontMetrics(font)
+        pixmap = QPixmap(metrics.horizontalAdvance(text), metrics.height())
+        pixmap.fill(Qt.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setPen(QColor(0x60, 0x60, 0x60))
+        painter.setFont(font)
+        painter.drawText(0, metrics.ascent(), text)
+        painter.end()
+        
+        return pixmap
+    
     def show_message(self, title: str, body: str):
         """Show a message overlay."""
         self.title = title
@@ -94,12 +118,7 @@ class MessageOverlay(QWidget):
         # Play chime sound
         self._play_chime()
         
-        # Start auto-dismiss timer
-        if self.auto_dismiss_timer:
-            self.auto_dismiss_timer.stop()
-        self.auto_dismiss_timer = QTimer(self)
-        self.auto_dismiss_timer.setSingleShot(True)
-        self.auto_dismiss_timer.timeout.connect(self.dismiss)
+        # (Re)start auto-dismiss timer
         self.auto_dismiss_timer.start(self.AUTO_DISMISS_MS)
         
         self.show()
@@ -119,14 +138,17 @@ class MessageOverlay(QWidget):
     
     def dismiss(self):
         """Dismiss the overlay."""
-        if self.auto_dismiss_timer:
-            self.auto_dismiss_timer.stop()
-            self.auto_dismiss_timer = None
+        self.auto_dismiss_timer.stop()
         
         self.hide()
         self.dismissed.emit()
         logger.info("Message overlay dismissed")
     
+    def paintEvent(self, event):
+        """Fill the dirty area black; the labels paint themselves on top."""
+        painter = QPainter(self)
+        painter.fillRect(event.rect(), Qt.black)
+    
     def keyPressEvent(self, event):
         """Handle key press - dismiss on A or any key."""
         key = event.key()
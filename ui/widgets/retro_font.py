@@ -0,0 +1,13 @@
+"""
+Retro Font
+Shared font helper for the text-based retro views.
+"""
+
+from PyQt5.QtGui import QFont
+
+
+def retro_font(size: int, weight: int = QFont.Normal) -> QFont:
+    """Courier New without antialiasing - blocky glyphs suit the retro look."""
+    font = QFont("Courier New", size, weight)
+    font.setStyleStrategy(QFont.NoAntialias | QFont.PreferBitmap)
+    return font
@@ -4,8 +4,11 @@ Executes intents by calling appropriate backend APIs.
 """
 
 import requests
-from typing import Optional
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from dataclasses import dataclass, field
+from functools import partial
+import time
+from typing import Dict, Any, Optional
 
 from command_parser import Intent, IntentType
 from responses import get_response, speak_response
@@ -14,6 +17,45 @@ from responses import get_response, speak_response
 # Backend API base URL
 API_BASE_URL = "http://localhost:5000"
 
+# (connect, read) - the API is local, so a slow connect means it is down
+API_TIMEOUT = (1, 10)
+
+# One pooled session so repeated commands reuse the loopback connection
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+_session.headers["Connection"] = "keep-alive"
+
+
+@dataclass(frozen=True)
+class _PostSpec:
+    """How an intent maps onto a backend POST and the replies to speak."""
+    endpoint: str
+    ok_response: str
+    error_response: Optional[str] = None       # Non-200 reply (None = stay silent)
+    conn_error_response: Optional[str] = None  # Unreachable API (None = stay silent)
+    params: Dict[str, Any] = field(default_factory=dict)  # JSON key -> default
+
+
+# Intents that are a single POST to the backend API
+POST_SPECS = {
+    IntentType.PLAY_MUSIC: _PostSpec(
+        "/music/play", "music_playing", "music_error", "connection_error",
+        params={"artist": ""},
+    ),
+    IntentType.STOP_MUSIC: _PostSpec(
+        "/music/stop", "music_stopped", "music_error", "connection_error",
+    ),
+    IntentType.SHOW_CLOCK: _PostSpec("/tap", "showing_clock"),
+    IntentType.SET_VOLUME: _PostSpec(
+        "/volume", "volume_set", "error", "connection_error",
+        params={"level": 50},
+    ),
+    IntentType.SET_BRIGHTNESS: _PostSpec(
+        "/brightness", "brightness_set", "error", "connection_error",
+        params={"level": 100},
+    ),
+}
+
 
 def execute_intent(intent: Intent) -> bool:
     """
@@ -25,18 +67,7 @@ def execute_intent(intent: Intent) -> bool:
     Returns:
         True if execution was successful
     """
-    handlers = {
-        IntentType.PLAY_MUSIC: _handle_play_music,
-        IntentType.STOP_MUSIC: _handle_stop_music,
-        IntentType.SAY_TIME: _handle_say_time,
-        IntentType.SHOW_CLOCK: _handle_show_clock,
-        IntentType.SET_VOLUME: _handle_set_volume,
-        IntentType.SET_BRIGHTNESS: _handle_set_brightness,
-        IntentType.GREETING: _handle_greeting,
-        IntentType.REPLY_UNKNOWN: _handle_unknown,
-    }
-    
-    handler = handlers.get(intent.type, _handle_unknown)
+    handler = _HANDLERS.get(intent.type, _handle_unknown)
     
     try:
         return handler(intent)
@@ -46,127 +77,44 @@ def execute_intent(intent: Intent) -> bool:
         return False
 
 
-def _handle_play_music(intent: Intent) -> bool:
-    """Handle play music intent."""
-    artist = intent.parameters.get('artist', '')
+def _post_intent(intent: Intent, spec: _PostSpec) -> bool:
+    """Handle an intent that is a single POST to the backend API."""
+    payload = {key: intent.parameters.get(key, default) for key, default in spec.params.items()}
     
     try:
-        response = requests.post(
-            f"{API_BASE_URL}/music/play",
-            json={"artist": artist},
-            timeout=10
-        )
-        
-        if response.status_code == 200:
-            speak_response(get_response("music_playing", artist=artist))
-            return True
-        else:
-            speak_response(get_response("music_error"))
-            return False
-            
-    except requests.RequestException as e:
-        print(f"API request failed: {e}")
-        speak_response(get_response("connection_error"))
-        return False
-
-
-def _handle_stop_music(intent: Intent) -> bool:
-    """Handle stop music intent."""
-    try:
-        response = requests.post(
-            f"{API_BASE_URL}/music/stop",
-            timeout=10
+        response = _session.post(
+            f"{API_BASE_URL}{spec.endpoint}",
+            json=payload or None,
+            timeout=API_TIMEOUT
         )
         
         if response.status_code == 200:
-            speak_response(get_response("music_stopped"))
+            speak_response(get_response(spec.ok_response, **payload))
             return True
         else:
-            speak_response(get_response("music_error"))
+            if spec.error_response:
+                speak_response(get_response(spec.error_response))
             return False
             
     except requests.RequestException as e:
         print(f"API request failed: {e}")
-        speak_response(get_response("connection_error"))
+        if spec.conn_error_response:
+            speak_response(get_response(spec.conn_error_response))
         return False
 
 
 def _handle_say_time(intent: Intent) -> bool:
     """Handle say time intent."""
-    now = datetime.now()
-    time_str = now.strftime("%I:%M %p")
+    # Formatted by hand - skips strftime's locale handling
+    now = time.localtime()
+    hour = now.tm_hour
+    ampm = "AM" if hour < 12 else "PM"
+    time_str = f"{hour % 12 or 12}:{now.tm_min:02d} {ampm}"
     
     speak_response(get_response("time", time=time_str))
     return True
 
 
-def _handle_show_clock(intent: Intent) -> bool:
-    """Handle show clock intent."""
-    try:
-        response = requests.post(
-            f"{API_BASE_URL}/tap",
-            timeout=10
-        )
-        
-        if response.status_code == 200:
-            speak_response(get_response("showing_clock"))
-            return True
-        else:
-            return False
-            
-    except requests.RequestException as e:
-        print(f"API request failed: {e}")
-        return False
-
-
-def _handle_set_volume(intent: Intent) -> bool:
-    """Handle set volume intent."""
-    level = intent.parameters.get('level', 50)
-    
-    try:
-        response = requests.post(
-            f"{API_BASE_URL}/volume",
-            json={"level": level},
-            timeout=10
-        )
-        
-        if response.status_code == 200:
-            speak_response(get_response("volume_set", level=level))
-            return True
-        else:
-            speak_response(get_response("error"))
-            return False
-            
-    except requests.RequestException as e:
-        print(f"API request failed: {e}")
-        speak_response(get_response("connection_error"))
-        return False
-
-
-def _handle_set_brightness(intent: Intent) -> bool:
-    """Handle set brightness intent."""
-    level = intent.parameters.get('level', 100)
-    
-    try:
-        response = requests.post(
-            f"{API_BASE_URL}/brightness",
-            json={"level": level},
-            timeout=10
-        )
-        
-        if response.status_code == 200:
-            speak_response(get_response("brightness_set", level=level))
-            return True
-        else:
-            speak_response(get_response("error"))
-            return False
-            
-    except requests.RequestException as e:
-        print(f"API request failed: {e}")
-        speak_response(get_response("connection_error"))
-        return False
-
-
 def _handle_greeting(intent: Intent) -> bool:
     """Handle greeting intent."""
     speak_response(get_response("greeting"))
@@ -177,3 +125,12 @@ def _handle_unknown(intent: Intent) -> bool:
     """Handle unknown intent."""
     speak_response(get_response("unknown"))
     return True
+
+
+# Built once at import rather than on every execute_intent call
+_HANDLERS = {
+    **{intent_type: partial(_post_intent, spec=spec) for intent_type, spec in POST_SPECS.items()},
+    IntentType.SAY_TIME: _handle_say_time,
+    IntentType.GREETING: _handle_greeting,
+    IntentType.REPLY_UNKNOWN: _handle_unknown,
+}
@@ -24,11 +24,40 @@ Command Parser Module
 Maps recognized text to structured intents.
 """
 
+import logging
 import re
+import sys
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+logger = logging.getLogger(__name__)
+
+# Optional: Aho-Corasick automaton for the trigger-word prefilter
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Optional: RE2 (linear-time, no backtracking) for the intent regex
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+
+def _compile(pattern: str):
+    """Compile with RE2 when installed, otherwise (or if RE2 rejects it) with re."""
+    if RE2_AVAILABLE:
+        try:
+            return re2.compile(pattern)
+        except Exception as e:
+            logger.warning("RE2 could not compile intent pattern, using re: %s", e)
+    return re.compile(pattern)
+
 
 class IntentType(Enum):
     """Enum of all recognized intent types."""
@@ -42,7 +71,22 @@ class IntentType(Enum):
     REPLY_UNKNOWN = "REPLY_UNKNOWN"
 
 
-@dataclass
+# Members bound once - skips the EnumMeta lookup on the per-command paths
+_PLAY = IntentType.PLAY_MUSIC
+_STOP = IntentType.STOP_MUSIC
+_TIME = IntentType.SAY_TIME
+_CLOCK = IntentType.SHOW_CLOCK
+_VOL = IntentType.SET_VOLUME
+_BRI = IntentType.SET_BRIGHTNESS
+_GREET = IntentType.GREETING
+_UNK = IntentType.REPLY_UNKNOWN
+
+
+# Slotted dataclasses need Python 3.10+; older versions keep a __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class Intent:
     """Represents a parsed intent with optional parameters."""
     type: IntentType
@@ -95,6 +139,92 @@ PATTERNS = {
 }
 
 
+def _combine_patterns(intent_types):
+    """
+    Fold the patterns of several intents into one compiled regex.
+    
+    Each pattern becomes a named alternative behind a lazy "skip ahead"
+    prefix, and the regex is used with match(). The engine therefore
+    tries the alternatives in PATTERNS order, each anywhere in the text,
+    so the first intent to match wins as it did with one search() per
+    pattern. A plain alternation with search() would prefer the leftmost
+    match instead.
+    
+    Returns:
+        (compiled regex, {group name: (intent type, parameter group index or None)})
+    """
+    alternatives = []
+    for intent_type in intent_types:
+        for idx, pattern in enumerate(PATTERNS[intent_type]):
+            alternatives.append(f"(?:[\\s\\S]*?(?P<{intent_type.name}_{idx}>{pattern}))")
+    # Case-insensitive, so callers needn't lower() the utterance first
+    combined = _compile("(?i)" + "|".join(alternatives))
+    
+    groups = {}
+    for intent_type in intent_types:
+        for idx, pattern in enumerate(PATTERNS[intent_type]):
+            name = f"{intent_type.name}_{idx}"
+            # A pattern's own capture group follows its named wrapper
+            has_param = re.compile(pattern).groups > 0
+            groups[name] = (intent_type, combined.groupindex[name] + 1 if has_param else None)
+    return combined, groups
+
+
+# Literals at least one of which appears in any text an intent's patterns
+# can match - cheap substring checks decide which regexes are worth running
+TRIGGERS = {
+    "play": [IntentType.PLAY_MUSIC],
+    "put on": [IntentType.PLAY_MUSIC],
+    "listen to": [IntentType.PLAY_MUSIC],
+    "stop": [IntentType.STOP_MUSIC],
+    "pause": [IntentType.STOP_MUSIC],
+    "turn off": [IntentType.STOP_MUSIC],
+    "time": [IntentType.SAY_TIME],
+    "clock": [IntentType.SHOW_CLOCK],
+    "volume": [IntentType.SET_VOLUME],
+    "brightness": [IntentType.SET_BRIGHTNESS],
+    "hey": [IntentType.GREETING],
+    "hi": [IntentType.GREETING],
+    "hello": [IntentType.GREETING],
+    "good": [IntentType.GREETING],
+    "wake up": [IntentType.GREETING],
+    "are you": [IntentType.GREETING],
+}
+
+# One linear pass finds every trigger; without pyahocorasick a lookahead
+# alternation does the same (so overlapping keywords like "stop playing"
+# are all found)
+if AHOCORASICK_AVAILABLE:
+    _TRIGGER_AUTOMATON = ahocorasick.Automaton()
+    for _keyword, _intents in TRIGGERS.items():
+        _TRIGGER_AUTOMATON.add_word(_keyword, _intents)
+    _TRIGGER_AUTOMATON.make_automaton()
+else:
+    _TRIGGER_RE = re.compile(
+        "(?=(" + "|".join(map(re.escape, sorted(TRIGGERS, key=len, reverse=True))) + "))",
+        re.IGNORECASE
+    )
+
+
+@lru_cache(maxsize=None)
+def _patterns_for(intent_types: tuple):
+    """Combined regex for a candidate set, compiled on first use (in PATTERNS order)."""
+    return _combine_patterns(intent_types)
+
+
+def _candidate_intents(text: str) -> tuple:
+    """Intents whose trigger words occur in the text (any case), in PATTERNS order."""
+    found = set()
+    if AHOCORASICK_AVAILABLE:
+        # The automaton is case-sensitive; only this path needs a lowered copy
+        for _end, intents in _TRIGGER_AUTOMATON.iter(text.lower()):
+            found.update(intents)
+    else:
+        for keyword in _TRIGGER_RE.findall(text):
+            found.update(TRIGGERS[keyword.lower()])
+    return tuple(intent_type for intent_type in PATTERNS if intent_type in found)
+
+
 def parse_command(text: str) -> Intent:
     """
     Parse a text command into a structured intent.
@@ -105,61 +235,99 @@ def parse_command(text: str) -> Intent:
     Returns:
         Intent object with type and parameters
     """
-    text_lower = text.lower().strip()
+    intent_type, parameters = _resolve(text.strip())
     
-    # Try to match against each intent pattern
-    for intent_type, patterns in PATTERNS.items():
-        for pattern in patterns:
-            match = re.search(pattern, text_lower)
-            if match:
-                parameters = _extract_parameters(intent_type, match)
-                return Intent(
-                    type=intent_type,
-                    parameters=parameters,
-                    raw_text=text
-                )
+    if intent_type is _UNK:
+        # No pattern matched - return unknown intent
+        return Intent(
+            type=_UNK,
+            parameters={},
+            raw_text=text,
+            confidence=0.0
+        )
     
-    # No pattern matched - return unknown intent
+    # Fresh Intent (and parameters dict) per call - only the lookup is shared
     return Intent(
-        type=IntentType.REPLY_UNKNOWN,
-        parameters={},
-        raw_text=text,
-        confidence=0.0
+        type=intent_type,
+        parameters=dict(parameters),
+        raw_text=text
     )
 
 
-def _extract_parameters(intent_type: IntentType, match: re.Match) -> Dict[str, Any]:
+@lru_cache(maxsize=256)
+def _resolve(text: str) -> tuple:
+    """
+    Match a stripped utterance to (intent type, parameter items).
+    
+    Memoised - the same few commands ("stop the music", "volume 50")
+    come up again and again.
     """
-    Extract parameters from a regex match based on intent type.
+    # Only intents whose trigger words are present can match; try their
+    # patterns, in priority order, in one regex call
+    candidates = _candidate_intents(text)
+    match = None
+    if candidates:
+        pattern, groups = _patterns_for(candidates)
+        match = pattern.match(text)
+    if not match:
+        return _UNK, ()
+    
+    intent_type, param_group = groups[match.lastgroup]
+    value = match.group(param_group) if param_group else None
+    return intent_type, tuple(_extract_parameters(intent_type, value).items())
+
+
+def clear_parse_cache():
+    """Forget memoised parses (e.g. between tests)."""
+    _resolve.cache_clear()
+
+
+def _parse_level(digits: str) -> int:
+    """
+    Convert a captured level to a percentage.
+    
+    The volume/brightness patterns only capture \\d+, so int() cannot fail
+    and no try/except is needed; the value is clamped to 0-100.
+    """
+    return min(int(digits), 100)
+
+
+# Intent -> builder for its parameters from the captured text
+_EXTRACTORS = {
+    _PLAY: lambda value: {'artist': value.strip()},
+    _VOL: lambda value: {'level': _parse_level(value)},
+    _BRI: lambda value: {'level': _parse_level(value)},
+}
+
+
+def _extract_parameters(intent_type: IntentType, value: Optional[str]) -> Dict[str, Any]:
+    """
+    Extract parameters from a pattern's captured text based on intent type.
     
     Args:
         intent_type: The matched intent type
-        match: The regex match object
+        value: Text captured by the matched pattern, or None if it has no group
         
     Returns:
         Dictionary of extracted parameters
     """
-    parameters = {}
-    
-    if intent_type == IntentType.PLAY_MUSIC:
-        if match.groups():
-            parameters['artist'] = match.group(1).strip()
-    
-    elif intent_type == IntentType.SET_VOLUME:
-        if match.groups():
-            try:
-                parameters['level'] = int(match.group(1))
-            except ValueError:
-                parameters['level'] = 50
-    
-    elif intent_type == IntentType.SET_BRIGHTNESS:
-        if match.groups():
-            try:
-                parameters['level'] = int(match.group(1))
-            except ValueError:
-                parameters['level'] = 100
-    
-    return parameters
+    extractor = _EXTRACTORS.get(intent_type)
+    if extractor is None or value is None:
+        return {}
+    return extractor(value)
+
+
+# Built once rather than on every get_intent_description() call
+_DESCRIPTIONS = {
+    _PLAY: lambda p: f"Play music: {p.get('artist', 'unknown')}",
+    _STOP: lambda p: "Stop music",
+    _TIME: lambda p: "Say the current time",
+    _CLOCK: lambda p: "Show clock display",
+    _VOL: lambda p: f"Set volume to {p.get('level', '?')}%",
+    _BRI: lambda p: f"Set brightness to {p.get('level', '?')}%",
+    _GREET: lambda p: "Greeting response",
+    _UNK: lambda p: "Unknown command",
+}
 
 
 def get_intent_description(intent: Intent) -> str:
@@ -172,16 +340,5 @@ def get_intent_description(intent: Intent) -> str:
     Returns:
         Human-readable description string
     """
-    descriptions = {
-        IntentType.PLAY_MUSIC: lambda p: f"Play music: {p.get('artist', 'unknown')}",
-        IntentType.STOP_MUSIC: lambda p: "Stop music",
-        IntentType.SAY_TIME: lambda p: "Say the current time",
-        IntentType.SHOW_CLOCK: lambda p: "Show clock display",
-        IntentType.SET_VOLUME: lambda p: f"Set volume to {p.get('level', '?')}%",
-        IntentType.SET_BRIGHTNESS: lambda p: f"Set brightness to {p.get('level', '?')}%",
-        IntentType.GREETING: lambda p: "Greeting response",
-        IntentType.REPLY_UNKNOWN: lambda p: "Unknown command",
-    }
-    
-    desc_func = descriptions.get(intent.type, lambda p: "Unknown")
-    return desc_func(intent.parameters)
+    desc_func = _DESCRIPTIONS.get(intent.type)
+    return desc_func(intent.parameters) if desc_func else "Unknown"
@@ -1,6 +1,28 @@
-def speak_response(text):
-    # Stub for TTS. Replace with local TTS engine if available (e.g., espeak, pyttsx3)
-    print(f'[TTS] {text}')
+"""
+Responses Module
+Response templates and text-to-speech output for voice commands.
+"""
+
+import logging
+import queue
+import string
+import sys
+import threading
+from typing import Callable, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyttsx3
+    TTS_AVAILABLE = True
+except ImportError:
+    TTS_AVAILABLE = False
+    pyttsx3 = None
+    logger.warning("pyttsx3 not installed. Text-to-speech disabled.")
+
+
+# Response templates
+RESPONSES: Dict[str, str] = {
     # Greetings
     "greeting": "Hello, I'm awake.",
     "goodbye": "Goodbye!",
@@ -34,6 +56,57 @@ def speak_response(text):
     "no_messages": "No new messages.",
 }
 
+_parser = string.Formatter()
+
+
+def _compile_template(template: str) -> Union[str, Callable[..., str]]:
+    """
+    Pre-parse a template once.
+    
+    Templates without fields come back as the finished string; the rest
+    become a callable that joins the literal parts with the values.
+    """
+    parts = list(_parser.parse(template))
+    fields = [field for _, field, _, _ in parts if field is not None]
+    if not fields:
+        return "".join(literal for literal, _, _, _ in parts)
+    
+    if any(not field.isidentifier() or spec or conversion
+           for _, field, spec, conversion in parts if field is not None):
+        # Format specs, conversions, indexing - leave those to str.format
+        return lambda **kwargs: template.format(**kwargs)
+    
+    pieces = [(literal, field) for literal, field, _, _ in parts]
+    
+    def render(**kwargs) -> str:
+        return "".join(
+            literal if field is None else literal + format(kwargs[field])
+            for literal, field in pieces
+        )
+    
+    return render
+
+
+# Pre-parsed RESPONSES, kept in step by add_response(): finished strings
+# for templates without fields, formatters for the rest
+_STATIC: Dict[str, str] = {}
+_DYNAMIC: Dict[str, Callable[..., str]] = {}
+
+
+def _register(key: str, template: str) -> None:
+    """File a template under _STATIC or _DYNAMIC."""
+    compiled = _compile_template(template)
+    if isinstance(compiled, str):
+        _STATIC[key] = sys.intern(compiled)
+        _DYNAMIC.pop(key, None)
+    else:
+        _DYNAMIC[key] = compiled
+        _STATIC.pop(key, None)
+
+
+for _key, _template in RESPONSES.items():
+    _register(_key, _template)
+
 
 def get_response(key: str, **kwargs) -> str:
     """
@@ -46,41 +119,90 @@ def get_response(key: str, **kwargs) -> str:
     Returns:
         The formatted response string
     """
-    template = RESPONSES.get(key, RESPONSES["unknown"])
+    text = _STATIC.get(key)
+    if text is not None:
+        return text
+    
+    formatter = _DYNAMIC.get(key)
+    if formatter is None:
+        key = "unknown"
+        text = _STATIC.get(key)
+        if text is not None:
+            return text
+        formatter = _DYNAMIC[key]
     
     try:
-        return template.format(**kwargs)
+        return formatter(**kwargs)
     except KeyError:
-        return template
+        return RESPONSES[key]
+
+
+# Speech runs on one worker thread that owns the (expensive) engine
+_tts_queue: "queue.Queue[Optional[str]]" = queue.Queue()
+_tts_thread: Optional[threading.Thread] = None
+_tts_lock = threading.Lock()
+
+
+def _tts_worker() -> None:
+    """Speak queued texts until the None sentinel arrives."""
+    # pyttsx3 engines must be driven from the thread that created them
+    try:
+        engine = pyttsx3.init()
+        engine.setProperty('rate', 150)  # Speed of speech
+        engine.setProperty('volume', 0.9)  # Volume (0-1)
+    except Exception as e:
+        logger.error("Text-to-speech error: %s", e)
+        engine = None
+    
+    while True:
+        text = _tts_queue.get()
+        if text is None:
+            break
+        if engine is None:
+            continue
+        try:
+            engine.say(text)
+            engine.runAndWait()
+        except Exception as e:
+            logger.error("Text-to-speech error: %s", e)
 
 
 def speak_response(text: str) -> bool:
     """
     Speak a response using text-to-speech.
     
+    Returns immediately; the text is spoken on a background thread.
+    
     Args:
         text: The text to speak
         
     Returns:
-        True if speech was successful
+        True if the text was queued for speech
     """
-    print(f"[SPEAK] {text}")
+    global _tts_thread
+    logger.info("[SPEAK] %s", text)
     
     if not TTS_AVAILABLE:
         return False
     
-    try:
-        engine = pyttsx3.init()
-        engine.setProperty('rate', 150)  # Speed of speech
-        engine.setProperty('volume', 0.9)  # Volume (0-1)
-        
-        engine.say(text)
-        engine.runAndWait()
-        
-        return True
-    except Exception as e:
-        print(f"Text-to-speech error: {e}")
-        return False
+    with _tts_lock:
+        if _tts_thread is None or not _tts_thread.is_alive():
+            _tts_thread = threading.Thread(target=_tts_worker, name="tts", daemon=True)
+            _tts_thread.start()
+        _tts_queue.put(text)
+    
+    return True
+
+
+def shutdown_tts(timeout: Optional[float] = None) -> None:
+    """Stop the speech thread once it has spoken what is already queued."""
+    global _tts_thread
+    with _tts_lock:
+        thread, _tts_thread = _tts_thread, None
+        if thread is None:
+            return
+        _tts_queue.put(None)
+    thread.join(timeout)
 
 
 def add_response(key: str, text: str) -> None:
@@ -92,6 +214,7 @@ def add_response(key: str, text: str) -> None:
         text: The response template text
     """
     RESPONSES[key] = text
+    _register(key, text)
 
 
 def list_responses() -> dict:
@@ -59,9 +59,16 @@ Captures speech and converts to text.
 Sends recognized text to command_parser for processing.
 """
 
-import time
+import json
+import logging
+import os
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, Callable
 
+logger = logging.getLogger(__name__)
+
 # Note: Requires speech_recognition package
 # pip install SpeechRecognition pyaudio
 
@@ -70,7 +77,28 @@ try:
     SPEECH_RECOGNITION_AVAILABLE = True
 except ImportError:
     SPEECH_RECOGNITION_AVAILABLE = False
-    print("Warning: speech_recognition not installed. Voice features disabled.")
+    logger.warning("speech_recognition not installed. Voice features disabled.")
+
+# Optional offline recognizer - no network round trip, works without internet
+try:
+    import vosk
+    VOSK_AVAILABLE = True
+except ImportError:
+    VOSK_AVAILABLE = False
+
+VOSK_MODEL_PATH = "vosk-model-small-en-us-0.15"
+VOSK_SAMPLE_RATE = 16000
+
+# Optional voice activity detector - drops silence/noise before recognition
+try:
+    import webrtcvad
+    VAD_AVAILABLE = True
+except ImportError:
+    VAD_AVAILABLE = False
+
+VAD_SAMPLE_RATE = 16000
+VAD_FRAME_BYTES = VAD_SAMPLE_RATE * 30 // 1000 * 2  # 30 ms of 16-bit mono
+VAD_MIN_VOICED = 0.3  # Fraction of frames that must contain speech
 
 
 class VoiceListener:
@@ -79,8 +107,28 @@ class VoiceListener:
     def __init__(self):
         self._recognizer: Optional[object] = None
         self._microphone: Optional[object] = None
-        self._is_listening: bool = False
+        # Set while not listening
+        self._stop_event = threading.Event()
+        self._stop_event.set()
+        # Stops speech_recognition's background capture thread
+        self._stop_fn: Optional[Callable[..., None]] = None
         self._on_text_callback: Optional[Callable[[str], None]] = None
+        # Recognition is a network round trip - run it off the capture thread
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="stt")
+        # Recognitions in capture order; one dispatcher thread (started on
+        # first use, kept across restarts) drains it so commands run in the
+        # order they were spoken
+        self._pending: "queue.Queue[Future]" = queue.Queue()
+        self._dispatcher: Optional[threading.Thread] = None
+        self._vosk_model: Optional[object] = None
+        self._vad = webrtcvad.Vad(3) if VAD_AVAILABLE else None
+        
+        if VOSK_AVAILABLE and os.path.isdir(VOSK_MODEL_PATH):
+            try:
+                self._vosk_model = vosk.Model(VOSK_MODEL_PATH)
+                logger.info("Using offline Vosk speech recognition")
+            except Exception as e:
+                logger.warning("Could not load Vosk model: %s", e)
         
         if SPEECH_RECOGNITION_AVAILABLE:
             self._recognizer = sr.Recognizer()
@@ -107,58 +155,166 @@ class VoiceListener:
             Recognized text or None if recognition failed
         """
         if not SPEECH_RECOGNITION_AVAILABLE:
-            print("Speech recognition not available")
+            logger.warning("Speech recognition not available")
+            return None
+        
+        if self.is_listening():
+            # Continuous listening already holds the microphone
+            logger.warning("Already listening continuously")
             return None
         
         try:
             with self._microphone as source:
-                print("Listening...")
-                audio = self._recognizer.listen(source, timeout=5, phrase_time_limit=10)
-            
+                audio = self._capture(source)
+        except Exception as e:
+            logger.error("Could not open microphone: %s", e)
+            return None
+        
+        return self._recognize(audio) if audio is not None else None
+    
+    def _capture(self, source) -> Optional[object]:
+        """Record one phrase from an open microphone source."""
+        try:
+            logger.debug("Listening...")
+            return self._recognizer.listen(source, timeout=5, phrase_time_limit=10)
+        except sr.WaitTimeoutError:
+            logger.debug("Listening timed out")
+            return None
+        except Exception as e:
+            logger.error("Error during recognition: %s", e)
+            return None
+    
+    def _recognize(self, audio) -> Optional[str]:
+        """Convert captured audio to text."""
+        try:
+            if not self._has_speech(audio):
+                logger.debug("No speech detected")
+                return None
+        except Exception as e:
+            logger.error("Error during recognition: %s", e)
+            return None
+        
+        if self._vosk_model is not None:
+            try:
+                text = self._recognize_vosk(audio)
+                if text:
+                    logger.info("Recognized: %s", text)
+                else:
+                    logger.info("Could not understand audio")
+                return text or None
+            except Exception as e:
+                logger.warning("Offline recognition error, trying Google: %s", e)
+        
+        try:
             # Use Google's speech recognition
             text = self._recognizer.recognize_google(audio)
-            print(f"Recognized: {text}")
+            logger.info("Recognized: %s", text)
             return text
             
-        except sr.WaitTimeoutError:
-            print("Listening timed out")
-            return None
         except sr.UnknownValueError:
-            print("Could not understand audio")
+            logger.info("Could not understand audio")
             return None
         except sr.RequestError as e:
-            print(f"Recognition service error: {e}")
+            logger.error("Recognition service error: %s", e)
             return None
         except Exception as e:
-            print(f"Error during recognition: {e}")
+            logger.error("Error during recognition: %s", e)
             return None
     
+    def _has_speech(self, audio) -> bool:
+        """Check that enough of the audio is voiced to be worth recognising."""
+        if self._vad is None:
+            return True
+        
+        raw = audio.get_raw_data(convert_rate=VAD_SAMPLE_RATE, convert_width=2)
+        frames = [
+            raw[i:i + VAD_FRAME_BYTES]
+            for i in range(0, len(raw) - VAD_FRAME_BYTES + 1, VAD_FRAME_BYTES)
+        ]
+        if not frames:
+            return False
+        
+        voiced = sum(self._vad.is_speech(frame, VAD_SAMPLE_RATE) for frame in frames)
+        return voiced >= VAD_MIN_VOICED * len(frames)
+    
+    def _recognize_vosk(self, audio) -> str:
+        """Decode audio locally with Vosk."""
+        # A recognizer per phrase - cheap next to the shared model, and
+        # safe with phrases being decoded on two pool threads at once
+        recognizer = vosk.KaldiRecognizer(self._vosk_model, VOSK_SAMPLE_RATE)
+        recognizer.AcceptWaveform(
+            audio.get_raw_data(convert_rate=VOSK_SAMPLE_RATE, convert_width=2)
+        )
+        return json.loads(recognizer.FinalResult()).get("text", "")
+    
     def start_continuous_listening(self) -> None:
-        """Start listening continuously for voice commands."""
+        """
+        Start listening continuously for voice commands.
+        
+        Returns immediately - capture runs on speech_recognition's
+        background thread, which keeps the audio stream open between
+        phrases. Use wait() to block until listening stops.
+        """
         if not SPEECH_RECOGNITION_AVAILABLE:
-            print("Speech recognition not available")
+            logger.warning("Speech recognition not available")
             return
         
-        self._is_listening = True
-        print("Starting continuous listening...")
+        if self.is_listening():
+            return
         
-        while self._is_listening:
-            text = self.listen_once()
-            
-            if text and self._on_text_callback:
-                self._on_text_callback(text)
-            
-            # Small delay between listening attempts
-            time.sleep(0.5)
+        self._stop_event.clear()
+        logger.info("Starting continuous listening...")
+        if self._dispatcher is None:
+            self._dispatcher = threading.Thread(
+                target=self._dispatch_loop, name="stt-dispatch", daemon=True
+            )
+            self._dispatcher.start()
+        self._stop_fn = self._recognizer.listen_in_background(
+            self._microphone, self._on_audio, phrase_time_limit=10
+        )
+    
+    def _on_audio(self, recognizer, audio) -> None:
+        """Capture-thread callback - queue the phrase for recognition."""
+        if self._stop_event.is_set():
+            return
+        # Recognition runs on the pool so capture never waits on it
+        self._pending.put(self._pool.submit(self._recognize, audio))
+    
+    def _dispatch_loop(self) -> None:
+        """Hand finished recognitions to the text callback in capture order."""
+        while True:
+            self._dispatch(self._pending.get())
+    
+    def _dispatch(self, future: Future) -> None:
+        """Wait for one recognition and pass its text to the callback."""
+        try:
+            text = future.result()
+        except Exception as e:
+            logger.error("Error during recognition: %s", e)
+            return
+        
+        if text and self._on_text_callback:
+            self._on_text_callback(text)
     
     def stop_listening(self) -> None:
         """Stop continuous listening."""
-        self._is_listening = False
-        print("Stopped listening")
+        if self._stop_event.is_set():
+            return
+        self._stop_event.set()
+        if self._stop_fn is not None:
+            # Wait for the capture thread to leave the microphone context, so
+            # an immediate restart or listen_once() can open it again
+            self._stop_fn(wait_for_stop=True)
+            self._stop_fn = None
+        logger.info("Stopped listening")
     
     def is_listening(self) -> bool:
         """Check if currently listening."""
-        return self._is_listening
+        return not self._stop_event.is_set()
+    
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until listening stops; False if the timeout expired first."""
+        return self._stop_event.wait(timeout)
 
 
 # Global instance
@@ -175,6 +331,11 @@ def get_voice_listener() -> VoiceListener:
 
 def main():
     """Main entry point for voice listener service."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     from command_parser import parse_command
     from actions import execute_intent
     
@@ -187,11 +348,12 @@ def main():
     
     listener.set_text_callback(on_text_received)
     
+    listener.start_continuous_listening()
     try:
-        listener.start_continuous_listening()
+        listener.wait()
     except KeyboardInterrupt:
         listener.stop_listening()
-        print("Voice listener stopped")
+        logger.info("Voice listener stopped")
 
 
 if __name__ == "__main__":